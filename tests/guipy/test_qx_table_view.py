@@ -0,0 +1,64 @@
+"""Tests for QxTableView."""
+
+# 1. Standard python modules
+
+# 2. Third party modules
+import pandas as pd
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from xms.guipy.dialogs.xms_parent_dlg import ensure_qapplication_exists
+from xms.guipy.models.qx_pandas_table_model import QxPandasTableModel
+from xms.guipy.widgets.qx_table_view import QxTableView
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+
+class _DoublingModel(QxPandasTableModel):
+    """Model that changes values as they are set."""
+
+    def setData(self, index, value, role=Qt.EditRole):  # noqa: N802
+        """Doubles the value before setting it.
+
+        Args:
+            index (QModelIndex): The index.
+            value: The value.
+            role (int): The role.
+
+        Returns:
+            (bool): True if the value was set.
+        """
+        return super().setData(index, float(value) * 2, role)
+
+
+def _paste(model, text):
+    """Pastes text into the top left cell of a table using the model.
+
+    Args:
+        model (QxPandasTableModel): The model.
+        text (str): The clipboard text.
+    """
+    ensure_qapplication_exists()
+    table_view = QxTableView()
+    table_view.setModel(model)
+    table_view.setCurrentIndex(model.index(0, 0))
+    QApplication.clipboard().setText(text)
+    table_view.on_paste()
+
+
+def test_paste():
+    """Test pasting a block of cells."""
+    model = QxPandasTableModel(pd.DataFrame({'a': [0.0, 0.0], 'b': [0.0, 0.0]}))
+    _paste(model, '1\t2\n3\t4\n')
+    assert model.data_frame.values.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+
+def test_paste_uses_overridden_set_data():
+    """Test pasting into a model that overrides setData() goes through setData()."""
+    model = _DoublingModel(pd.DataFrame({'a': [0.0, 0.0], 'b': [0.0, 0.0]}))
+    _paste(model, '1\t2\n3\t4\n')
+    assert model.data_frame.values.tolist() == [[2.0, 4.0], [6.0, 8.0]]
@@ -567,6 +567,32 @@ class ToolTests(unittest.TestCase):
             param_qt_helper.add_param(layout, param_obj)
         assert str(runtime_error.value).startswith('Unsupported "param" parameter type: ')
 
+    def test_do_param_widgets_only_sets_changed_values(self):
+        """Test do_param_widgets only sets the widgets of params whose values changed."""
+        parent_dialog = QObject()
+        layout = QVBoxLayout()
+        params = [
+            {'type': 'Integer', 'name': 'one', 'description': 'Argument 1', 'value': 1},
+            {'type': 'String', 'name': 'two', 'description': 'Argument 2', 'value': 'a'},
+        ]
+        param_qt_helper = ParamQtHelper(parent_dialog)
+        param_qt_helper.add_params_to_layout(layout, params)
+        param_qt_helper.do_param_widgets(None)
+        one_widget = param_qt_helper.param_dict['one'].value_widget
+        two_widget = param_qt_helper.param_dict['two'].value_widget
+        assert '1' == one_widget.text()
+        assert 'a' == two_widget.text()
+
+        # Unchanged values aren't set again
+        two_widget.setText('not yet read')
+        param_qt_helper.do_param_widgets('one')
+        assert 'not yet read' == two_widget.text()
+
+        # Changed values are
+        params[1]['value'] = 'b'
+        param_qt_helper.do_param_widgets('one')
+        assert 'b' == two_widget.text()
+
     def test_empty_file_argument(self):
         """Test empty file argument retrieves empty string."""
         data_handler = self._test_data_handler()
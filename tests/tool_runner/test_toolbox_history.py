@@ -1,6 +1,7 @@
 """Tests for Tool class."""
 
 # 1. Standard python modules
+import math
 import os
 
 # 2. Third party modules
@@ -8,7 +9,7 @@ import os
 # 3. Aquaveo modules
 
 # 4. Local modules
-from xms.tool_runner.toolbox_history import ToolboxHistory
+from xms.tool_runner.toolbox_history import load_history_file, ToolboxHistory
 
 __copyright__ = "(C) Copyright Aquaveo 2020"
 __license__ = "All rights reserved"
@@ -20,3 +21,77 @@ def test_read_history_file(test_files_path):
     history = ToolboxHistory()
     history.read_history_file(project_folder)
     assert len(history.history) == 6
+
+
+def test_load_history_file_without_history(test_files_path):
+    """Test reading the history of a project that doesn't have a history file."""
+    assert load_history_file(test_files_path) == []
+
+
+def test_get_history_index_from_uuid_after_delete():
+    """Test finding history items after an earlier item is deleted."""
+    history = ToolboxHistory()
+    uuids = [f'history-{i}' for i in range(4)]
+    for i, uuid in enumerate(uuids):
+        history.add_item({'name': f'Tool {i}', 'date': '2024-01-01', 'time': f'10:00:0{i}', 'history_uuid': uuid})
+    history.delete_item(uuids[1])
+    assert history.get_history_index_from_uuid(uuids[1]) is None
+    assert [history.get_history_index_from_uuid(uuid) for uuid in uuids] == [0, None, 1, 2]
+    assert history.get_run_input(uuids[2])['name'] == 'Tool 2'
+
+
+def test_delete_item_removes_model_rows():
+    """Test that deleting history items removes them, and dates left empty, from the model."""
+    history = ToolboxHistory()
+    history.add_item({'name': 'Tool 0', 'date': '2024-01-01', 'time': '10:00:00', 'history_uuid': 'history-0'})
+    history.add_item({'name': 'Tool 1', 'date': '2024-01-01', 'time': '10:00:01', 'history_uuid': 'history-1'})
+    history.add_item({'name': 'Tool 2', 'date': '2024-01-02', 'time': '10:00:02', 'history_uuid': 'history-2'})
+    history.delete_item('history-0')
+    model = history.get_model()
+    assert model.rowCount() == 2
+    assert model.item(0).rowCount() == 1
+    assert model.item(0).child(0).data() == 'history-1'
+    history.delete_item('history-2')
+    assert model.rowCount() == 1
+    assert model.item(0).text() == '2024-01-01'
+
+
+def test_set_search_strings():
+    """Test that searching shows only the history items and lines that match."""
+    history = ToolboxHistory()
+    history.add_item({'name': 'Smooth', 'date': '2024-01-01', 'time': '10:00:00', 'history_uuid': 'history-0',
+                      'arguments': [{'name': 'input', 'value': 'elevation'}, {'name': 'passes', 'value': 2}]})
+    history.add_item({'name': 'Merge', 'date': '2024-01-02', 'time': '10:00:01', 'history_uuid': 'history-1',
+                      'arguments': [{'name': 'input', 'value': 'depth'}]})
+    history.set_search_strings(['ELEV'])
+    model = history.history_search_model
+    assert model.rowCount() == 1
+    date_index = model.index(0, 0)
+    notes_index = model.index(0, 0, date_index)
+    assert notes_index.data() == 'Smooth 2024-01-01 10:00:00'
+    input_index = model.index(0, 0, notes_index)
+    assert model.rowCount(input_index) == 1
+    assert model.index(0, 0, input_index).data() == 'input: elevation'
+
+
+def test_write_history_file(tmp_path):
+    """Test that a written history file reads back the same history."""
+    history = ToolboxHistory()
+    history.add_item({'name': 'Smooth', 'date': '2024-01-01', 'time': '10:00:00', 'history_uuid': 'history-0',
+                      'arguments': [{'name': 'passes', 'value': 2}], 'output': 'Done\n'})
+    history.write_history_file(str(tmp_path))
+    assert load_history_file(str(tmp_path)) == history.history
+    assert os.listdir(tmp_path) == ['history.json']
+
+
+def test_write_history_file_with_nan(tmp_path):
+    """Test that NaN and infinite argument values survive writing and reading the history file."""
+    history = ToolboxHistory()
+    history.add_item({'name': 'Smooth', 'date': '2024-01-01', 'time': '10:00:00', 'history_uuid': 'history-0',
+                      'arguments': [{'name': 'low', 'value': float('nan')}, {'name': 'high', 'value': float('inf')}]})
+    history.write_history_file(str(tmp_path))
+    with open(os.path.join(tmp_path, 'history.json')) as file:
+        assert file.read().startswith('[\n    {')
+    arguments = load_history_file(str(tmp_path))[0]['arguments']
+    assert math.isnan(arguments[0]['value'])
+    assert arguments[1]['value'] == float('inf')
@@ -0,0 +1,78 @@
+"""Tests for export_project."""
+
+# 1. Standard python modules
+import filecmp
+import logging
+import os
+from pathlib import Path
+
+# 2. Third party modules
+import pytest
+
+# 3. Aquaveo modules
+
+# 4. Local modules
+from xms.tool_runner.tools import export_project
+
+__copyright__ = "(C) Copyright Aquaveo 2024"
+__license__ = "All rights reserved"
+
+
+def _get_project_grids(test_files_path) -> dict:
+    """Returns a dictionary of grids by UUID, for the grids and datasets in the 'Project' test folder.
+
+    Args:
+        test_files_path: The path to the 'tests/files' folder.
+    """
+    grid_folder = Path(test_files_path) / 'Project' / 'grids'
+    return {
+        'uuid-1': {
+            'name': 'UGrid 1', 'file': grid_folder / 'UGrid 1.xmc',
+            'datasets': [{'name': 'Dset 1', 'file': grid_folder / 'UGrid 1' / 'Dset 1.h5'}]
+        },
+        'uuid-2': {
+            'name': 'UGrid 2', 'file': grid_folder / 'UGrid 2.xmc',
+            'datasets': [
+                {'name': 'Dset 2', 'file': grid_folder / 'UGrid 2' / 'Dset 2.h5'},
+                {'name': 'Folder/Dset 3', 'file': grid_folder / 'UGrid 2' / 'Dset 3.h5'},
+            ]
+        },
+    }
+
+
+def test_copy_files(test_files_path, tmp_path, caplog):
+    """Test copying several grids and datasets."""
+    grids = _get_project_grids(test_files_path)
+    output_folder = tmp_path / 'export'
+    logger = logging.getLogger('test_export_project')
+    with caplog.at_level(logging.INFO, logger='test_export_project'):
+        export_project._copy_files(grids, logger, str(output_folder))
+
+    copied = {
+        'UGrid 1.xmc': grids['uuid-1']['file'],
+        os.path.join('UGrid 1', 'Dset 1.h5'): grids['uuid-1']['datasets'][0]['file'],
+        'UGrid 2.xmc': grids['uuid-2']['file'],
+        os.path.join('UGrid 2', 'Dset 2.h5'): grids['uuid-2']['datasets'][0]['file'],
+        os.path.join('UGrid 2', 'Folder', 'Dset 3.h5'): grids['uuid-2']['datasets'][1]['file'],
+    }
+    for copy_to, copy_from in copied.items():
+        assert filecmp.cmp(output_folder / 'grids' / copy_to, copy_from, shallow=False)
+    assert sorted(caplog.messages) == [
+        'Copied dataset Dset 1.', 'Copied dataset Dset 2.', 'Copied dataset Folder/Dset 3.', 'Copied grid UGrid 1.',
+        'Copied grid UGrid 2.'
+    ]
+
+
+def test_copy_files_error(test_files_path, tmp_path, monkeypatch):
+    """Test that a failed copy raises the original error."""
+    copyfile = export_project.xfs.copyfile
+
+    def fail_dset_2(copy_from, copy_to):
+        if copy_from.endswith('Dset 2.h5'):
+            raise PermissionError(f'Permission denied: {copy_to}')
+        copyfile(copy_from, copy_to)
+
+    monkeypatch.setattr(export_project.xfs, 'copyfile', fail_dset_2)
+    grids = _get_project_grids(test_files_path)
+    with pytest.raises(PermissionError, match='Dset 2.h5'):
+        export_project._copy_files(grids, logging.getLogger('test_export_project'), str(tmp_path / 'export'))
@@ -7,6 +7,7 @@ import subprocess
 from unittest import mock
 
 # 2. Third party modules
+import numpy as np
 import pytest
 
 # 3. Aquaveo modules
@@ -54,7 +55,7 @@ class SubprocessRun:
 
         Args:
             arguments: The command line arguments to be passed to the gdaltransform tool.
-            **kwargs: Additional keyword arguments including check, stdin, and stdout.
+            **kwargs: Additional keyword arguments including check and input.
         """
         if "gdaltransform" in arguments[0]:
             return self._process_gdaltransform(arguments, **kwargs)
@@ -66,17 +67,21 @@ class SubprocessRun:
 
         Args:
             arguments: The command line arguments to be passed to the gdaltransform tool.
-            **kwargs: Additional keyword arguments including stdin and stdout.
+            **kwargs: Additional keyword arguments including check and input.
+
+        Returns:
+            A subprocess.CompletedProcess object with the mocked standard output.
         """
         if self.mock_values["gdaltransform"]["failure"] and kwargs.pop("check"):
             raise subprocess.CalledProcessError(-1, arguments, self.mock_values["gdaltransform"]["failure"])
 
         self.mock_values["gdaltransform"]["arguments"] = arguments
-        stdin = kwargs.pop("stdin")
-        self.mock_values["gdaltransform"]["stdin"] = stdin.read()
+        self.mock_values["gdaltransform"]["stdin"] = kwargs.pop("input")
+        exit_code = self.mock_values["gdaltransform"]["exit_code"]
+        stdout = self.mock_values["gdaltransform"]["stdout"]
+        stderr = self.mock_values["gdaltransform"]["stderr"]
 
-        stdout = kwargs.pop("stdout")
-        stdout.write(self.mock_values["gdaltransform"]["stdout"])
+        return subprocess.CompletedProcess(arguments, exit_code, stdout, stderr)
 
     def _process_gdalsrsinfo(self, arguments, **kwargs):
         """Mock of running gdalsrsinfo tool.
@@ -203,6 +208,25 @@ def test_run_tool_with_path(mock_subprocess_run, tool, test_files_path):
     assert filecmp.cmp(base_file, out_file, shallow=False)
 
 
+@mock.patch('xms.tool_runner.tools.transform_ugrid_points_tool.subprocess.run')
+def test_transform_points_with_fractions(mock_subprocess_run, tool):
+    """Test that fractional coordinates are passed to gdaltransform without losing precision."""
+    subprocess_run = SubprocessRun()
+    subprocess_run.mock_values["gdaltransform"]["stdout"] = (
+        "-111.6574963628 40.271514127177 10.25\n"
+        "-111.656337674 40.273322561347 11.0\n"
+    )
+    mock_subprocess_run.side_effect = subprocess_run
+
+    locations_in = np.array([[444100.125, 4458100.3, 10.25], [444200.1234567891, 4458300.0, 11.0]])
+    locations_out = tool._transform_points("", locations_in, 2956, 4979)
+
+    expected_stdin = '444100.125 4458100.2999999998 10.25\n444200.12345678912 4458300 11\n'
+    assert expected_stdin == subprocess_run.mock_values["gdaltransform"]["stdin"]
+    expected_out = [[-111.6574963628, 40.271514127177, 10.25], [-111.656337674, 40.273322561347, 11.0]]
+    np.testing.assert_array_equal(locations_out, expected_out)
+
+
 @mock.patch('xms.tool_runner.tools.transform_ugrid_points_tool.subprocess.run')
 def test_transform_error(mock_subprocess_run, tool, test_files_path):
     """Test when gdaltransform fails."""
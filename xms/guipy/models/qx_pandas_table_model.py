@@ -152,21 +152,10 @@ class QxPandasTableModel(QAbstractTableModel):
 
             dtype = self.data_frame[col].dtype
             is_date_time_col = is_datetime_or_timedelta_dtype(self.data_frame[col])
-
-            if index.column() in self.checkbox_columns:
-                value = 1 if value else 0  # Assume checkbox columns are integers 0 and 1
-            elif index.column() in self.combobox_columns and isinstance(value, str):
-                value = self._match_value_to_combo_box_item(value, index)
-                if np.issubdtype(dtype, np.integer):  # Check for integer combobox option indices
-                    value = self._match_value_to_combo_box_index(index, value)
-            elif dtype != object:
-                try:
-                    if is_date_time_col:
-                        value = pd.to_datetime(value)
-                    else:
-                        value = None if value == '' else dtype.type(value)
-                except ValueError:
-                    return False
+            try:
+                value = self._convert_value(index, value, dtype, is_date_time_col)
+            except ValueError:
+                return False
 
             if self.data_frame.loc[row, col] != value:
                 self.data_frame.at[row, col] = value
@@ -175,6 +164,79 @@ class QxPandasTableModel(QAbstractTableModel):
 
         return False
 
+    def _convert_value(self, index, value, dtype, is_date_time_col):
+        """Returns the value converted to what should be stored in the DataFrame at index.
+
+        Args:
+            index (QModelIndex): The index.
+            value: The value.
+            dtype: The dtype of the DataFrame column.
+            is_date_time_col (bool): True if the column is a datetime or timedelta column.
+
+        Returns:
+            The converted value. Raises ValueError if the value can't be converted.
+        """
+        if index.column() in self.checkbox_columns:
+            value = 1 if value else 0  # Assume checkbox columns are integers 0 and 1
+        elif index.column() in self.combobox_columns and isinstance(value, str):
+            value = self._match_value_to_combo_box_item(value, index)
+            if np.issubdtype(dtype, np.integer):  # Check for integer combobox option indices
+                value = self._match_value_to_combo_box_index(index, value)
+        elif dtype != object:
+            if is_date_time_col:
+                value = pd.to_datetime(value)
+            else:
+                value = None if value == '' else dtype.type(value)
+        return value
+
+    def set_block(self, row, column, values):
+        """Sets a rectangular block of values with one DataFrame assignment per column, e.g. when pasting.
+
+        Values are converted the same way as in setData(). Values that would be outside the table are ignored.
+        dataChanged is emitted once for the whole block.
+
+        Args:
+            row (int): Top row of the block.
+            column (int): Left column of the block.
+            values (list[list]): The values as a list of rows. Rows can have different lengths.
+
+        Returns:
+            (list[str]): Error messages for the cells that could not be set.
+        """
+        errors = []
+        row_count = min(len(values), self.rowCount() - row)
+        column_count = min(max((len(row_values) for row_values in values), default=0), self.columnCount() - column)
+        if row_count <= 0 or column_count <= 0:
+            return errors
+
+        for col in range(column, column + column_count):
+            series = self.data_frame.iloc[:, col]
+            dtype = series.dtype
+            is_date_time_col = is_datetime_or_timedelta_dtype(series)
+            j = col - column
+            rows = []
+            new_values = []
+            for r in range(row, row + row_count):
+                row_values = values[r - row]
+                if j >= len(row_values):
+                    continue
+                if col in self.read_only_columns or (r, col) in self.read_only_cells:
+                    errors.append(f'Error setting data in row: {r + 1}, column: {col + 1}')
+                    continue
+                try:
+                    new_values.append(self._convert_value(self.index(r, col), row_values[j], dtype, is_date_time_col))
+                except ValueError:
+                    errors.append(f'Error setting data in row: {r + 1}, column: {col + 1}')
+                    continue
+                rows.append(r)
+            if rows:
+                self.data_frame.iloc[rows, col] = new_values
+
+        top_left = self.index(row, column)
+        bottom_right = self.index(row + row_count - 1, column + column_count - 1)
+        self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.EditRole])
+        return errors
+
     def headerData(self, section, orientation, role=Qt.DisplayRole):  # noqa: N802
         """Returns the data for the given role and section in the header.
 
@@ -288,6 +350,15 @@ class QxPandasTableModel(QAbstractTableModel):
         """
         self.combobox_columns[column] = items
 
+    def set_combobox_columns(self, combobox_columns):
+        """Tells the model that the columns are combo box delegates with the given items, all at once.
+
+        Args:
+            combobox_columns (dict{int -> list[str] | int}): Column -> combo box strings (or column containing them).
+
+        """
+        self.combobox_columns.update(combobox_columns)
+
     def set_default_values(self, defaults):
         """Sets the column default values.
 
@@ -4,7 +4,7 @@ import os
 import re
 
 # 2. Third party modules
-from PySide6.QtCore import QAbstractProxyModel, QModelIndex, QSize, Qt, Signal
+from PySide6.QtCore import QAbstractProxyModel, QSize, Qt, Signal
 from PySide6.QtGui import QKeySequence
 from PySide6.QtWidgets import QApplication, QTableView
 
@@ -13,10 +13,14 @@ from PySide6.QtWidgets import QApplication, QTableView
 # 4. Local modules
 from xms.guipy.delegates.qx_cbx_delegate import QxCbxDelegate
 from xms.guipy.dialogs.message_box import message_with_ok
+from xms.guipy.models.qx_pandas_table_model import QxPandasTableModel
 
 __copyright__ = "(C) Copyright Aquaveo 2019"
 __license__ = "All rights reserved"
 
+_DEFAULT_PASTE_DELIMITER = '\t'
+_DEFAULT_PASTE_DELIMITER_RE = re.compile(_DEFAULT_PASTE_DELIMITER)
+
 
 class QxTableView(QTableView):
     """QTableView implementation for use in XMS packages."""
@@ -31,11 +35,30 @@ class QxTableView(QTableView):
         super().__init__(parent)
         self.pasting = False
         self.size_to_contents = False
-        self.paste_delimiter = '\t'  # Overwrite if want to support pasting text that is not tab delimited.
+        # Overwrite paste_delimiter if want to support pasting text that is not tab delimited.
+        self._paste_delimiter = _DEFAULT_PASTE_DELIMITER
+        self._paste_delimiter_re = _DEFAULT_PASTE_DELIMITER_RE
 
         # Set this to False if you don't want to set columns with combobox delegates as combobox columns in the model.
         self.set_cbx_columns_in_model = True
         self.paste_errors = []
+        self._combo_box_popup_connected = False
+        self._cbx_columns: set[int] = set()  # Columns with QxCbxDelegate delegates. See setItemDelegateForColumn().
+
+    @property
+    def paste_delimiter(self) -> str:
+        """The regular expression used to split pasted rows into columns."""
+        return self._paste_delimiter
+
+    @paste_delimiter.setter
+    def paste_delimiter(self, value: str) -> None:
+        """Sets the paste delimiter and compiles it so it isn't looked up for every pasted row.
+
+        Args:
+            value: The regular expression used to split pasted rows into columns.
+        """
+        self._paste_delimiter = value
+        self._paste_delimiter_re = re.compile(value)
 
     def sizeHint(self):  # noqa: N802
         """Returns the size hint. Overridden to size width to contents.
@@ -51,11 +74,9 @@ class QxTableView(QTableView):
             s = QSize()
             s.setHeight(super().sizeHint().height())
             horz_header = self.horizontalHeader()
-            count = horz_header.count()
-            row_width = 0
-            for i in range(count):
-                if not horz_header.isSectionHidden(i):
-                    row_width += horz_header.sectionSize(i)
+            is_hidden = horz_header.isSectionHidden
+            section_size = horz_header.sectionSize
+            row_width = sum(section_size(i) for i in range(horz_header.count()) if not is_hidden(i))
             s.setWidth(row_width + 5)  # 5 is a buffer. Looks better
             return s
 
@@ -79,9 +100,9 @@ class QxTableView(QTableView):
                 handled = True
 
         # at least one cell selected
-        if not handled and self.selectedIndexes():
+        selected_indexes = self.selectedIndexes() if not handled else None
+        if selected_indexes:
             if event.key() == Qt.Key_Delete:
-                selected_indexes = self.selectedIndexes()
                 for index in selected_indexes:
                     self.model().setData(index, '')
 
@@ -112,8 +133,9 @@ class QxTableView(QTableView):
         self.pasting = True
         self.paste_errors = []
         text = QApplication.clipboard().text()
-        clipboard_rows = list(filter(None, text.split("\n")))
-        init_index = self.selectedIndexes()[0]
+        clipboard_rows = [row for row in text.splitlines() if row]  # Handles '\r\n' from Windows clipboards too
+        selected_indexes = self.selectedIndexes()
+        init_index = selected_indexes[0]
         init_row = init_index.row()
         init_col = init_index.column()
 
@@ -122,30 +144,43 @@ class QxTableView(QTableView):
             count = init_row + len(clipboard_rows) - self.model().rowCount()
             self.model().insertRows(self.model().rowCount(), count)
 
-        selected_count = len(self.selectedIndexes())
+        model = self.model()
+        selected_count = len(selected_indexes)
         row_offset = 0
-        if len(clipboard_rows) == 1 and selected_count > 1:
+        bottom_row = bottom_col = -1  # Extent of the pasted cells, so we only signal that those changed
+        paste_one_row_into_many = len(clipboard_rows) == 1 and selected_count > 1
+        if self._can_paste_block(model):
+            # Write the whole pasted rectangle in one go. The model emits dataChanged itself.
+            block = [self._paste_delimiter_re.split(clipboard_row) for clipboard_row in clipboard_rows]
+            if paste_one_row_into_many:
+                block *= selected_indexes[-1].row() - init_row + 1
+            self.paste_errors.extend(model.set_block(init_row, init_col, block))
+        elif paste_one_row_into_many:
             # Paste one row into multiple selected rows by repeatedly pasting the one row
-            last_index = self.selectedIndexes()[-1]
+            last_index = selected_indexes[-1]
             last_row = last_index.row()
             for row in range(init_row, last_row + 1):
-                self.paste_row(
+                pasted_row, pasted_col = self.paste_row(
                     clipboard_index=0,
                     clipboard_rows=clipboard_rows,
                     init_row=row,
                     init_col=init_col,
                     row_offset=row_offset
                 )
+                bottom_row = max(bottom_row, pasted_row)
+                bottom_col = max(bottom_col, pasted_col)
         else:
             # Paste one or more rows into the table (doesn't matter how many are selected)
             for i in range(len(clipboard_rows)):
-                self.paste_row(
+                pasted_row, pasted_col = self.paste_row(
                     clipboard_index=i,
                     clipboard_rows=clipboard_rows,
                     init_row=init_row,
                     init_col=init_col,
                     row_offset=row_offset
                 )
+                bottom_row = max(bottom_row, pasted_row)
+                bottom_col = max(bottom_col, pasted_col)
 
         self.pasting = False
         if self.paste_errors:
@@ -156,9 +191,26 @@ class QxTableView(QTableView):
             message_with_ok(
                 parent=self.window(), message=msg, app_name=app_name, icon='Error', win_icon=None, details=details
             )
-        self.model().dataChanged.emit(QModelIndex(), QModelIndex())  # Needed to update the table view
+        # Needed to update the table view. Bounded to the pasted cells so views only repaint what changed.
+        bottom_row = min(bottom_row, model.rowCount() - 1)
+        bottom_col = min(bottom_col, model.columnCount() - 1)
+        if bottom_row >= init_row and bottom_col >= init_col:
+            top_left = model.index(init_row, init_col)
+            bottom_right = model.index(bottom_row, bottom_col)
+            model.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.EditRole])
         self.pasted.emit()
 
+    def _can_paste_block(self, model) -> bool:
+        """Returns True if the pasted cells can be written as one block using the model's set_block() method.
+
+        set_block() writes to the DataFrame directly, so it is only used when the model doesn't override setData().
+
+        Args:
+            model (QAbstractItemModel): The model.
+        """
+        return (isinstance(model, QxPandasTableModel) and type(model).setData is QxPandasTableModel.setData
+                and not self._has_hidden_rows() and not self._has_hidden_columns())
+
     def paste_row(self, clipboard_index, clipboard_rows, init_row, init_col, row_offset):
         """Paste a row to the table.
 
@@ -168,26 +220,33 @@ class QxTableView(QTableView):
             init_row (int): Upper left index of table row where we're pasting.
             init_col (int): Upper left index of table column where we're pasting.
             row_offset (int): Increases as hidden rows are skipped.
+
+        Returns:
+            (tuple[int, int]): The table row and the last table column pasted to.
         """
         # Skip hidden rows
         row = init_row + clipboard_index + row_offset
-        while self.isRowHidden(row):
-            row_offset += 1
-            row += 1
+        if self._has_hidden_rows():
+            while self.isRowHidden(row):
+                row_offset += 1
+                row += 1
 
-        column_contents = re.split(self.paste_delimiter, clipboard_rows[clipboard_index])
+        column_contents = self._paste_delimiter_re.split(clipboard_rows[clipboard_index])
+        has_hidden_columns = self._has_hidden_columns()
         column_offset = 0
+        col = init_col - 1
         for j in range(len(column_contents)):
 
             # Skip hidden columns
             col = init_col + j + column_offset
-            while self.isColumnHidden(col):
+            while has_hidden_columns and self.isColumnHidden(col):
                 column_offset += 1
                 col += 1
 
             if row < self.model().rowCount() and col < self.model().columnCount():
                 if not self.model().setData(self.model().index(row, col), column_contents[j]):
                     self.paste_errors.append(f'Error setting data in row: {row + 1}, column: {col + 1}')
+        return row, col
 
     def on_copy(self):
         """Copies data from the selected cells to the clipboard."""
@@ -198,15 +257,25 @@ class QxTableView(QTableView):
         selection_model = self.selectionModel()
         selection = selection_model.selection()
         selection_range = selection.first()
+        has_hidden_rows = self._has_hidden_rows()
+        has_hidden_columns = self._has_hidden_columns()
         for i in range(selection_range.top(), selection_range.bottom() + 1):
             row_contents = []
-            if not self.isRowHidden(i):
+            if not has_hidden_rows or not self.isRowHidden(i):
                 for j in range(selection_range.left(), selection_range.right() + 1):
-                    if not self.isColumnHidden(j):
+                    if not has_hidden_columns or not self.isColumnHidden(j):
                         row_contents.append(self.model().index(i, j).data())
             text = text + tab.join(str(cell_contents) for cell_contents in row_contents) + '\n'
         QApplication.clipboard().setText(text)
 
+    def _has_hidden_rows(self) -> bool:
+        """Returns True if any rows are hidden, so callers can skip checking each row."""
+        return self.verticalHeader().hiddenSectionCount() > 0
+
+    def _has_hidden_columns(self) -> bool:
+        """Returns True if any columns are hidden, so callers can skip checking each column."""
+        return self.horizontalHeader().hiddenSectionCount() > 0
+
     def setItemDelegateForColumn(self, column, delegate):  # noqa: N802
         """Override of base class version so we can handle delegates on paste.
 
@@ -227,17 +296,23 @@ class QxTableView(QTableView):
 
         # Call the base class
         super().setItemDelegateForColumn(column, delegate)
+        if isinstance(delegate, QxCbxDelegate):
+            self._cbx_columns.add(column)
+        else:
+            self._cbx_columns.discard(column)
+
+        # Delegates added after setModel() need the selectionChanged connection that setModel() skipped
+        if isinstance(delegate, QxCbxDelegate) and not self._combo_box_popup_connected:
+            self._connect_show_combo_box_popup()
 
     def resize_height_to_contents(self):
         """Resize the table view height based on the number of rows."""
         vert_header = self.verticalHeader()
-        count = vert_header.count()
         scrollbar_height = self.horizontalScrollBar().height()
         header_height = self.horizontalHeader().height()
-        row_height = 0
-        for i in range(count):
-            if not vert_header.isSectionHidden(i):
-                row_height += vert_header.sectionSize(i)
+        is_hidden = vert_header.isSectionHidden
+        section_size = vert_header.sectionSize
+        row_height = sum(section_size(i) for i in range(vert_header.count()) if not is_hidden(i))
         self.setMinimumHeight(scrollbar_height + header_height + row_height)
 
     def setModel(self, model) -> None:  # noqa: N802
@@ -250,9 +325,15 @@ class QxTableView(QTableView):
         self._connect_show_combo_box_popup()
 
     def _connect_show_combo_box_popup(self):
-        """Connects the selectionChanged signal to the _show_combo_box_popup() slot."""
-        if self.selectionModel():
+        """Connects the selectionChanged signal to the _show_combo_box_popup() slot.
+
+        The signal is only connected if there are combo box delegates, so tables without them don't pay for the slot on
+        every selection change. setItemDelegateForColumn() connects it later if a combo box delegate is added.
+        """
+        self._combo_box_popup_connected = False
+        if self.selectionModel() and self._cbx_columns:
             self.selectionModel().selectionChanged.connect(self._show_combo_box_popup)
+            self._combo_box_popup_connected = True
 
     def _show_combo_box_popup(self, current, previous) -> None:
         """If attached to QTableView.selectionModel().selectionChanged signal, shows combo box delegate menu on click.
@@ -267,21 +348,11 @@ class QxTableView(QTableView):
             current (QItemSelection): current index.
             previous (QItemSelection): previous index.
         """
-        combo_box_delegate_columns = self._get_combo_box_delegate_columns()
-        if combo_box_delegate_columns:
-            indexes = current.indexes()
-            if len(indexes) == 1:
-                index = indexes[0]
-                if index.column() in combo_box_delegate_columns:
-                    self.edit(index)
-
-    def _get_combo_box_delegate_columns(self) -> set[int] | None:
-        """Returns a set of integers indicating the columns that have QxCbxDelegate delegates."""
-        combo_box_delegate_columns = set()
-        model = self.model()
-        if model:
-            for column in range(model.columnCount()):
-                delegate = self.itemDelegateForColumn(column)
-                if delegate and isinstance(delegate, QxCbxDelegate):
-                    combo_box_delegate_columns.add(column)
-        return combo_box_delegate_columns
+        if not self._cbx_columns:
+            return
+
+        indexes = current.indexes()
+        if len(indexes) == 1:
+            index = indexes[0]
+            if index.column() in self._cbx_columns:
+                self.edit(index)
@@ -8,7 +8,7 @@ from pathlib import Path
 
 # 2. Third party modules
 import pandas as pd
-from PySide6.QtCore import QItemSelectionModel, QModelIndex, Qt, Signal
+from PySide6.QtCore import QItemSelection, QItemSelectionModel, QModelIndex, Qt, QTimer, Signal
 from PySide6.QtGui import QDoubleValidator
 from PySide6.QtWidgets import QWidget
 
@@ -56,6 +56,7 @@ class TableWithToolBar(QWidget):
 
         self._table_def = None
         self._actions = None
+        self._toolbar_update_pending = False
 
     def setup(self, table_definition: TableDefinition, df: pd.DataFrame):
         """Initializes the class.
@@ -161,6 +162,7 @@ class TableWithToolBar(QWidget):
     def _add_delegates(self) -> None:
         """Creates the column delegates using the column types."""
         check_box_columns = set()
+        combo_box_columns = {}
         for col_idx, column_type in enumerate(self._table_def.column_types):
             delegate = None
             if isinstance(column_type, StringColumnType) and column_type.choices:
@@ -169,7 +171,7 @@ class TableWithToolBar(QWidget):
                     delegate.set_choices_column(column_type.choices, self.ui.table.model())
                 else:
                     delegate.set_strings(column_type.choices)
-                self.ui.table.model().set_combobox_column(col_idx, column_type.choices)
+                combo_box_columns[col_idx] = column_type.choices
             elif isinstance(column_type, IntColumnType):
                 if column_type.spinbox:
                     delegate = SpinBoxDelegate(self, minimum=column_type.low, maximum=column_type.high)
@@ -191,6 +193,8 @@ class TableWithToolBar(QWidget):
             if delegate:
                 self.ui.table.setItemDelegateForColumn(col_idx, delegate)
 
+        if combo_box_columns:
+            self.ui.table.model().set_combobox_columns(combo_box_columns)
         if check_box_columns:
             self.ui.table.model().set_checkbox_columns(check_box_columns)
 
@@ -265,8 +269,7 @@ class TableWithToolBar(QWidget):
 
     def _get_unique_sorted_selected_rows(self) -> list[int]:
         """Returns the set of selected row numbers (0-based), in order from least to greatest."""
-        selected_list = self.ui.table.selectedIndexes()
-        return sorted(list({index.row() for index in selected_list}))
+        return sorted({index.row() for index in self.ui.table.selectedIndexes()})
 
     def _reselect_rows(self, selected_rows: list[int]) -> None:
         """Selects the rows in the table that were selected before as indicated by selected_rows.
@@ -274,12 +277,20 @@ class TableWithToolBar(QWidget):
         Args:
             selected_rows(list[int]): List of rows.
         """
+        model = self.ui.table.model()
+        row_count = model.rowCount()
+        last_column = model.columnCount() - 1
+        selection = QItemSelection()
         for row in selected_rows:
-            if row >= self.ui.table.model().rowCount():
-                row = self.ui.table.model().rowCount() - 1
-            idx = self.ui.table.model().createIndex(row, 0)
-            flags = QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows
-            self.ui.table.selectionModel().select(idx, flags)
+            if row >= row_count:
+                row = row_count - 1
+            if row < 0:
+                continue
+            selection.select(model.index(row, 0), model.index(row, last_column))
+
+        # Select everything at once so selectionChanged is only emitted once
+        flags = QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows
+        self.ui.table.selectionModel().select(selection, flags)
 
     def _move_row(self, up, selected_row, selected_column):
         """Moves a row up or down.
@@ -350,10 +361,21 @@ class TableWithToolBar(QWidget):
         self._enable_toolbar()
 
     def _enable_toolbar(self):
+        """Schedules a toolbar update, coalescing multiple requests into one per event loop iteration."""
+        if self._toolbar_update_pending:
+            return
+        self._toolbar_update_pending = True
+        QTimer.singleShot(0, self._flush_toolbar)
+
+    def _flush_toolbar(self):
+        """Performs the toolbar update scheduled by _enable_toolbar()."""
+        self._toolbar_update_pending = False
+        self._do_enable_toolbar()
+
+    def _do_enable_toolbar(self):
         """Enables and disables things."""
-        selected_list = self.ui.table.selectedIndexes()
-        selections_exist = len(selected_list) > 0
         selected_rows = self._get_unique_sorted_selected_rows()
+        selections_exist = len(selected_rows) > 0
         if self._table_def.fixed_row_count is None:
             self.ui.tool_bar.widgetForAction(self._actions[self.INSERT_SVG]).setEnabled(selections_exist)
             self.ui.tool_bar.widgetForAction(self._actions[self.DELETE_SVG]).setEnabled(selections_exist)
@@ -377,7 +399,11 @@ def _setup_table_context_menus(table, header_column_method, general_method):
 
 
 def _rows_are_contiguous(unique_selected_rows):
-    """Returns true if the selected rows are not contiguous."""
+    """Returns true if the selected rows are contiguous.
+
+    Args:
+        unique_selected_rows (list[int]): Unique row numbers. Must be sorted in ascending order.
+    """
     if not unique_selected_rows:
         return False
-    return len(unique_selected_rows) == max(unique_selected_rows) - min(unique_selected_rows) + 1
+    return len(unique_selected_rows) == unique_selected_rows[-1] - unique_selected_rows[0] + 1
@@ -1,8 +1,9 @@
 """Methods to construct Qt Widgets for XMS Python dialogs."""
 # 1. Standard python modules
+import datetime
+from functools import lru_cache
 
 # 2. Third party modules
-from dateutil import parser
 from PySide6.QtCore import QDateTime, Qt
 from PySide6.QtGui import QAction, QFontMetrics, QIcon, QPalette, QTextCursor
 from PySide6.QtWidgets import QHeaderView, QMenu
@@ -18,6 +19,49 @@ from xms.guipy.widgets.qx_table_view import QxTableView
 __copyright__ = "(C) Copyright Aquaveo 2019"
 __license__ = "All rights reserved"
 
+# Stylesheets used by style_table
+_TABLE_CORNER_STYLE = (
+    'QTableView QTableCornerButton::section {'
+    ' border-top: 0px solid lightgrey;'
+    ' border-bottom: 1px solid lightgrey;'
+    ' border-right: 1px solid lightgrey;'
+    ' border-left: 0px solid lightgrey;}'
+)
+_TABLE_HORIZONTAL_HEADER_STYLE = (
+    'QHeaderView::section {'
+    ' border-top: 0px solid lightgrey;'
+    ' border-bottom: 1px solid lightgrey;'
+    ' border-right: 1px solid lightgrey;'
+    ' border-left: 0px solid lightgrey; }'
+)
+_TABLE_VERTICAL_HEADER_STYLE = (
+    'QHeaderView::section {'
+    ' border-top: 0px solid lightgrey;'
+    ' border-bottom: 1px solid lightgrey;'
+    ' border-right: 1px solid lightgrey;'
+    ' border-left: 0px solid lightgrey;'
+    ' padding-left: 4px;'
+    ' padding-right: 0px; }'
+)
+
+# Icon file path -> QIcon. See _get_icon.
+_icons = {}
+
+# QPalette.cacheKey() of a line edit's palette -> its read-only palette. See make_lineedit_readonly. The key changes
+# whenever a palette is modified, so only the most recently added few are kept.
+_READ_ONLY_PALETTE_CACHE_SIZE = 16
+_read_only_palettes = {}
+
+# The same few menu icons are looked up every time a context menu is shown
+_get_resource_path = lru_cache(maxsize=256)(resources_util.get_resource_path)
+
+# Formats tried after ISO 8601 and before falling back to dateutil. Month first, like dateutil's default.
+_KNOWN_DATETIME_FORMATS = (
+    '%m/%d/%Y %H:%M:%S',
+    '%m/%d/%Y %I:%M:%S %p',
+    '%m/%d/%Y',
+)
+
 
 def setup_context_menu(widget, menu_lists):
     """Sets up a context menu on the widget with the items in menu_lists.
@@ -32,8 +76,8 @@ def setup_context_menu(widget, menu_lists):
     menu = QMenu(widget)
     for item in menu_lists:
         if item[0]:
-            icon_path = resources_util.get_resource_path(item[0])
-            action = QAction(QIcon(icon_path), item[1], widget)
+            icon_path = _get_resource_path(item[0])
+            action = QAction(_get_icon(icon_path), item[1], widget)
         else:
             action = QAction(item[1], widget)
         menu.addAction(action)
@@ -56,27 +100,63 @@ def setup_toolbar(toolbar, button_list):
     Returns:
         (dict): base icon filenames -> actions
     """
+    # Create all the actions first and add them with one call so the toolbar is only laid out once
     actions = {}
-    for i in range(len(button_list)):
-        if not button_list[i]:
-            toolbar.addSeparator()
+    toolbar_actions = []
+    for button in button_list:
+        if not button:
+            action = QAction(toolbar)
+            action.setSeparator(True)
         else:
-            icon_path = button_list[i][0]
-            description = button_list[i][1]
-            function = button_list[i][2]
-            actions[icon_path] = toolbar.addAction(QIcon(icon_path), description, function)
+            icon_path, description, function = button[0], button[1], button[2]
+            action = QAction(_get_icon(icon_path), description, toolbar)
+            action.triggered.connect(function)
+            actions[icon_path] = action
+        toolbar_actions.append(action)
+    toolbar.addActions(toolbar_actions)
     return actions
 
 
+def _get_icon(icon_path):
+    """Returns the QIcon for the icon file, creating it only the first time the file is asked for.
+
+    Args:
+        icon_path (str): Path to the icon file.
+
+    Returns:
+        (QIcon): The icon.
+    """
+    icon = _icons.get(icon_path)
+    if icon is None:
+        icon = _icons[icon_path] = QIcon(icon_path)
+    return icon
+
+
+@lru_cache(maxsize=1024)
 def datetime_from_string(datetime_string):
     """Parses a date/time string and returns a python datetime object.
 
+    ISO 8601 strings (what we usually write ourselves) and a few other known formats are parsed directly. Anything
+    else goes to the much slower, but more forgiving, dateutil parser. Results are cached since the same strings tend
+    to get parsed repeatedly, and datetime objects are immutable.
+
     Args:
         datetime_string:
 
     Returns:
         (datetime.datetime): The datetime object.
     """
+    try:
+        return datetime.datetime.fromisoformat(datetime_string)
+    except ValueError:
+        pass
+    for datetime_format in _KNOWN_DATETIME_FORMATS:
+        try:
+            return datetime.datetime.strptime(datetime_string, datetime_format)
+        except ValueError:
+            pass
+
+    from dateutil import parser  # Only imported if it is actually needed since it is slow to import
     return parser.parse(datetime_string)
 
 
@@ -89,8 +169,12 @@ def qdatetime_from_string(datetime_string):
     Returns:
         (QDateTime): The QDateTime object.
     """
-    datetime = datetime_from_string(datetime_string)
-    return QDateTime.fromString(datetime.isoformat(), Qt.ISODate)
+    # Strings we wrote ourselves are usually already ISO, so let Qt try them first
+    qdt = QDateTime.fromString(datetime_string, Qt.ISODate)
+    if qdt.isValid():
+        return qdt
+    dt = datetime_from_string(datetime_string)
+    return QDateTime.fromString(dt.isoformat(), Qt.ISODate)
 
 
 def datetime_from_string_using_qt(datetime_string):
@@ -155,18 +239,12 @@ def resize_columns_to_contents(table_view):
     Args:
         table_view (QTableView): The table view.
     """
-    table_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-
-    # Save column widths
-    column_widths = []
-    for i in range(table_view.horizontalHeader().count()):
-        column_widths.append(table_view.horizontalHeader().sectionSize(i))
-
-    table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
-
-    # Set column widths
-    for i in range(table_view.horizontalHeader().count()):
-        table_view.horizontalHeader().resizeSection(i, column_widths[i])
+    # Compute the widths from the size hints, the same way ResizeToContents does, rather than switching the resize
+    # mode to ResizeToContents and back, which makes Qt lay out the header twice.
+    header = table_view.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.Interactive)
+    for i in range(header.count()):
+        header.resizeSection(i, max(table_view.sizeHintForColumn(i), header.sectionSizeHint(i)))
 
 
 def insert_gridlayout_rows(start, count, layout):
@@ -179,24 +257,16 @@ def insert_gridlayout_rows(start, count, layout):
         count (int): Number of rows to insert.
         layout: The layout.
     """
+    # Take items from the back so the indices of the items we haven't looked at yet don't shift
     moved_items = []
-    i = 0
-    while i < layout.count() > 0:
+    for i in range(layout.count() - 1, -1, -1):
         row, column, row_span, column_span = layout.getItemPosition(i)
         if row >= start:
-            qlist = [row + count, column, row_span, column_span]
-            moved_items.append((layout.takeAt(i), qlist))
-            i -= 1
-        i += 1
+            moved_items.append((layout.takeAt(i), row + count, column, row_span, column_span))
 
-    for i in range(len(moved_items)):
-        layout.addItem(
-            moved_items[i][0],
-            moved_items[i][1][0],
-            moved_items[i][1][1],
-            moved_items[i][1][2],
-            moved_items[i][1][3],
-        )
+    # Add them back in their original order
+    for item, row, column, row_span, column_span in reversed(moved_items):
+        layout.addItem(item, row, column, row_span, column_span)
 
 
 def make_lineedit_readonly(line_edit):
@@ -207,11 +277,15 @@ def make_lineedit_readonly(line_edit):
     Args:
         line_edit: The QLineEdit
     """
-    read_only_palette = line_edit.palette()
-    color1 = read_only_palette.color(QPalette.Window)
-    color2 = read_only_palette.color(QPalette.WindowText)
-    read_only_palette.setColor(QPalette.Base, color1)
-    read_only_palette.setColor(QPalette.Text, color2)
+    palette = line_edit.palette()
+    read_only_palette = _read_only_palettes.get(palette.cacheKey())
+    if read_only_palette is None:
+        read_only_palette = QPalette(palette)
+        read_only_palette.setColor(QPalette.Base, palette.color(QPalette.Window))
+        read_only_palette.setColor(QPalette.Text, palette.color(QPalette.WindowText))
+        if len(_read_only_palettes) >= _READ_ONLY_PALETTE_CACHE_SIZE:
+            del _read_only_palettes[next(iter(_read_only_palettes))]  # The oldest
+        _read_only_palettes[palette.cacheKey()] = read_only_palette
     line_edit.setReadOnly(True)
     line_edit.setPalette(read_only_palette)
 
@@ -238,13 +312,17 @@ def fill_edt_with_file(file_name, widget, header):
         widget (QPlainTextEdit): text edit
         header (str): header for the data in the edit
     """
-    widget.appendPlainText(header)
-    if file_name:
-        with open(file_name, 'r') as file:
-            txt = file.read().replace(' ', '\t')
-            widget.appendPlainText(txt)
-    widget.setReadOnly(True)
-    widget.moveCursor(QTextCursor.Start)
+    # Don't repaint until all the text is in and the cursor is back at the start
+    widget.setUpdatesEnabled(False)
+    try:
+        widget.appendPlainText(header)
+        if file_name:
+            with open(file_name, 'r') as file:
+                widget.appendPlainText(file.read().replace(' ', '\t'))
+        widget.setReadOnly(True)
+        widget.moveCursor(QTextCursor.Start)
+    finally:
+        widget.setUpdatesEnabled(True)
 
 
 def style_table_view(table_view):
@@ -267,26 +345,11 @@ def style_table(table):
         table (QTableView | QTableWidget): The table.
     """
     table.setMinimumHeight(150)  # I just think this looks better
-    corner_style = 'QTableView QTableCornerButton::section {' \
-                   ' border-top: 0px solid lightgrey;' \
-                   ' border-bottom: 1px solid lightgrey;' \
-                   ' border-right: 1px solid lightgrey;' \
-                   ' border-left: 0px solid lightgrey;}'
-    table.setStyleSheet(corner_style)
-    h_style = 'QHeaderView::section {' \
-              ' border-top: 0px solid lightgrey;' \
-              ' border-bottom: 1px solid lightgrey;' \
-              ' border-right: 1px solid lightgrey;' \
-              ' border-left: 0px solid lightgrey; }'
-    v_style = 'QHeaderView::section {' \
-              ' border-top: 0px solid lightgrey;' \
-              ' border-bottom: 1px solid lightgrey;' \
-              ' border-right: 1px solid lightgrey;' \
-              ' border-left: 0px solid lightgrey;' \
-              ' padding-left: 4px;' \
-              ' padding-right: 0px; }'
-    table.horizontalHeader().setStyleSheet(h_style)
-    table.verticalHeader().setStyleSheet(v_style)
+    table.setStyleSheet(_TABLE_CORNER_STYLE)
+    horizontal_header = table.horizontalHeader()
+    vertical_header = table.verticalHeader()
+    horizontal_header.setStyleSheet(_TABLE_HORIZONTAL_HEADER_STYLE)
+    vertical_header.setStyleSheet(_TABLE_VERTICAL_HEADER_STYLE)
 
 
 def new_styled_table_view():
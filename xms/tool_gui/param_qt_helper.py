@@ -4,11 +4,12 @@ __copyright__ = "(C) Copyright Aquaveo 2019"
 __license__ = "All rights reserved"
 
 # 1. Standard python modules
+from functools import partial
 import os
+import weakref
 
 # 2. Third party modules
-import pandas as pd
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QSignalBlocker, Signal
 from PySide6.QtGui import QDoubleValidator, QIntValidator
 from PySide6.QtWidgets import (QCheckBox, QComboBox, QFileDialog, QHBoxLayout, QLabel, QLineEdit, QPushButton,
                                QSizePolicy)
@@ -22,6 +23,95 @@ from xms.tool_core.table_definition import TableDefinition
 # 4. Local modules
 
 
+class _ParamEntry:
+    """The widgets and accessors for one param, stored in ParamQtHelper.param_dict."""
+
+    __slots__ = (
+        'parent_class', 'value_widget', 'value_getter', 'value_setter', 'widget_list', 'is_file_argument',
+        'file_filter', 'default_suffix', 'select_folder', 'value_action'
+    )
+
+    def __init__(
+        self, parent_class, value_widget, value_getter, value_setter, widget_list, is_file_argument, file_filter,
+        default_suffix, select_folder, value_action
+    ):
+        """Initializes the class.
+
+        Args:
+            parent_class (dict): The param.
+            value_widget (QWidget): The widget showing the param's value.
+            value_getter: Callable returning the value shown in value_widget.
+            value_setter: Callable setting the value shown in value_widget.
+            widget_list (list[QWidget]): All the param's widgets.
+            is_file_argument (bool): True if the param is a file or folder.
+            file_filter (str): The file dialog filter, if a file argument.
+            default_suffix (str): The file dialog default suffix, if a file argument.
+            select_folder (bool): True if the param is a folder.
+            value_action (QWidget): The button that opens the file dialog, if a file argument.
+        """
+        self.parent_class = parent_class
+        self.value_widget = value_widget
+        self.value_getter = value_getter
+        self.value_setter = value_setter
+        self.widget_list = widget_list
+        self.is_file_argument = is_file_argument
+        self.file_filter = file_filter
+        self.default_suffix = default_suffix
+        self.select_folder = select_folder
+        self.value_action = value_action
+
+    def __getitem__(self, key):
+        """Gets an attribute by name, so the entry can still be used like the dict it replaced.
+
+        Args:
+            key (str): The attribute name.
+
+        Returns:
+            The attribute's value.
+        """
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        """Sets an attribute by name, so the entry can still be used like the dict it replaced.
+
+        Args:
+            key (str): The attribute name.
+            value: The attribute's value.
+        """
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        """Returns True if the entry has an attribute named key.
+
+        A None value_action counts as absent, since the dict only held it for file arguments.
+
+        Args:
+            key (str): The attribute name.
+
+        Returns:
+            (bool): See description.
+        """
+        if key == 'value_action':
+            return self.value_action is not None
+        return key in self.__slots__
+
+    def get(self, key, default=None):
+        """Gets an attribute by name, like dict.get().
+
+        Args:
+            key (str): The attribute name.
+            default: The value to return if there is no such attribute.
+
+        Returns:
+            The attribute's value, or default.
+        """
+        return getattr(self, key) if key in self else default
+
+
 class ParamQtHelper(QObject):
     """Add widgets to layout for a parameterized object."""
 
@@ -37,7 +127,10 @@ class ParamQtHelper(QObject):
         super().__init__()
         self.parent_dialog = parent_dialog
         self.param_dict = dict()
-        self.do_param_widgets_call_count = 0
+        self.widget_values = dict()  # Param name -> value last shown in the param's widget
+        # Validators don't hold any per-widget state, so all the edit fields share these
+        self._double_validator = QDoubleValidator(self)
+        self._int_validator = QIntValidator(self)
         self.param_horizontal_layouts = dict()
         self.param_groups = dict()
 
@@ -48,11 +141,31 @@ class ParamQtHelper(QObject):
             layout (QBoxLayout): The layout to append to
             params (QObject): Qt parent of the param
         """
-        # get param classes ordered by original precedence and add them to the vertical layout
+        # Hold off repainting until all the params are added
+        parent_widget = layout.parentWidget()
+        updates_enabled = parent_widget is not None and parent_widget.updatesEnabled()
+        if updates_enabled:
+            parent_widget.setUpdatesEnabled(False)
+        try:
+            # get param classes ordered by original precedence and add them to the vertical layout
+            for param in params:
+                self.add_param(layout, param)
+        finally:
+            if updates_enabled:
+                parent_widget.setUpdatesEnabled(True)
+
+    def update_params(self, params: list[dict[str, object]]):
+        """Points the existing widgets at new param objects.
+
+        The params must be the same ones, in all but value, as those the widgets were added for.
+
+        Args:
+            params (list[dict[str, object]]): The new param objects.
+        """
         for param in params:
-            self.add_param(layout, param)
+            self.param_dict[param['name']].parent_class = param
 
-    def add_param(self, layout, param: dict):  # noqa: C901
+    def add_param(self, layout, param: dict):
         """Add param objects.
 
         Args:
@@ -60,181 +173,208 @@ class ParamQtHelper(QObject):
             param: The param object
         """
         ptype = param['type']
+        builder = _PARAM_BUILDERS.get(ptype)
+        if builder is None:
+            raise RuntimeError(f'Unsupported "param" parameter type: {ptype}')
+
         # widgets = widget_depends[param_name] if widget_depends and param_name in widget_depends else []
         widgets = []
         param_name = param['name']
         label_str = param['description']
         file_filter = param.get('file_filter', None)
         default_suffix = param.get('default_suffix', None)
-        select_folder = False
         if len(label_str) > 0 and ptype != 'Boolean':
             widget_label = label_str + ':'
             widgets.append(QLabel(widget_label))
             widgets[-1].setAccessibleName(param_name + ' label')
             layout.addWidget(widgets[-1])
 
-        value_action = None
-        if ptype == 'StringSelector':
-            widgets.append(QComboBox())
-            layout.addWidget(widgets[-1])
-            widgets[-1].addItems(param['choices'])
-            widgets[-1].currentIndexChanged.connect(lambda: self.do_param_widgets(param_name))
-            widgets[-1].currentIndexChanged.connect(lambda: self.on_end_do_param_widgets())
-            widgets[-1].setAccessibleName(param_name)
-            value_widget = widgets[-1]
-            value_setter = widgets[-1].setCurrentText
-            value_getter = widgets[-1].currentText
-            is_file_argument = False
-        elif ptype == 'Number':
-            widgets.append(QLineEdit())
-            layout.addWidget(widgets[-1])
-            validator = QDoubleValidator(self)
-            widgets[-1].setValidator(validator)
-            widgets[-1].installEventFilter(NumberCorrector(self))
-            widgets[-1].editingFinished.connect(lambda: self.do_param_widgets(param_name))
-            widgets[-1].editingFinished.connect(lambda: self.on_end_do_param_widgets())
-            widgets[-1].setAccessibleName(param_name)
-            value_widget = widgets[-1]
-            value_setter = widgets[-1].setText
-            value_getter = lambda: float(widgets[-1].text())  # noqa: E731
-            is_file_argument = False
-        elif ptype == 'Integer':
-            widgets.append(QLineEdit())
-            layout.addWidget(widgets[-1])
-            widgets[-1].setValidator(QIntValidator())
-            widgets[-1].editingFinished.connect(lambda: self.do_param_widgets(param_name))
-            widgets[-1].editingFinished.connect(lambda: self.on_end_do_param_widgets())
-            widgets[-1].setAccessibleName(param_name)
-            value_widget = widgets[-1]
-            value_setter = widgets[-1].setText
-            value_getter = lambda: int(widgets[-1].text())  # noqa: E731
-            is_file_argument = False
-        elif ptype == 'SelectFile':
-            hor_layout = QHBoxLayout()
-            layout.addLayout(hor_layout)
-            widgets.append(QPushButton('Select File...'))
-            button = widgets[-1]
-            hor_layout.addWidget(button)
-            button.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Maximum)
-            widgets[-1].setAccessibleName(param_name + '_select')
-            # connect to the button click
-            widgets.append(QLabel())
-            hor_layout.addWidget(widgets[-1])
-            button.clicked.connect(lambda: self.do_open_selector(param_name, widgets[-1]))
-            widgets[-1].setAccessibleName(param_name)
-            value_widget = widgets[-1]
-            value_setter = widgets[-1].setText
-            value_getter = widgets[-1].text
-            value_action = button
-            is_file_argument = True
-        elif ptype == 'SaveFile':
-            hor_layout = QHBoxLayout()
-            layout.addLayout(hor_layout)
-            widgets.append(QPushButton('Save As...'))
-            button = widgets[-1]
-            hor_layout.addWidget(button)
-            button.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Maximum)
-            widgets[-1].setAccessibleName(param_name + '_select')
-            # connect to the button click
-            widgets.append(QLabel())
-            hor_layout.addWidget(widgets[-1])
-            button.clicked.connect(lambda: self.do_save_as_selector(param_name, widgets[-1]))
-            widgets[-1].setAccessibleName(param_name)
-            value_widget = widgets[-1]
-            value_setter = widgets[-1].setText
-            value_getter = widgets[-1].text
-            value_action = button
-            is_file_argument = True
-        elif ptype == 'SelectFolder':
-            hor_layout = QHBoxLayout()
-            layout.addLayout(hor_layout)
-            widgets.append(QPushButton('Select File...'))
-            button = widgets[-1]
-            hor_layout.addWidget(button)
-            button.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Maximum)
-            widgets[-1].setAccessibleName(param_name + '_select')
-            # connect to the button click
-            widgets.append(QLabel())
-            hor_layout.addWidget(widgets[-1])
-            button.clicked.connect(lambda: self.do_open_selector(param_name, widgets[-1]))
-            widgets[-1].setAccessibleName(param_name)
-            value_widget = widgets[-1]
-            value_setter = widgets[-1].setText
-            value_getter = widgets[-1].text
-            value_action = button
-            is_file_argument = True
-            select_folder = True
-        elif ptype == 'SaveFolder':
-            hor_layout = QHBoxLayout()
-            layout.addLayout(hor_layout)
-            widgets.append(QPushButton('Save As...'))
-            button = widgets[-1]
-            hor_layout.addWidget(button)
-            button.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Maximum)
-            widgets[-1].setAccessibleName(param_name + '_select')
-            # connect to the button click
-            widgets.append(QLabel())
-            hor_layout.addWidget(widgets[-1])
-            button.clicked.connect(lambda: self.do_save_as_selector(param_name, widgets[-1]))
-            widgets[-1].setAccessibleName(param_name)
-            value_widget = widgets[-1]
-            value_setter = widgets[-1].setText
-            value_getter = widgets[-1].text
-            value_action = button
-            is_file_argument = True
-            select_folder = True
-        elif ptype == 'String':
-            widgets.append(QLineEdit())
-            layout.addWidget(widgets[-1])
-            widgets[-1].editingFinished.connect(lambda: self.do_param_widgets(param_name))
-            widgets[-1].editingFinished.connect(lambda: self.on_end_do_param_widgets())
-            widgets[-1].setAccessibleName(param_name)
-            value_widget = widgets[-1]
-            value_setter = widgets[-1].setText
-            value_getter = widgets[-1].text
-            is_file_argument = False
-        elif ptype == 'Boolean':
-            widgets.append(QCheckBox(label_str))
-            layout.addWidget(widgets[-1])
-            widgets[-1].clicked.connect(lambda: self.do_param_widgets(param_name))
-            widgets[-1].clicked.connect(lambda: self.on_end_do_param_widgets())
-            widgets[-1].setAccessibleName(param_name)
-            value_widget = widgets[-1]
-            value_setter = widgets[-1].setChecked
-            value_getter = widgets[-1].isChecked
-            is_file_argument = False
-        elif ptype == 'Table':
-            widgets.append(TableWithToolBar())
-            table_definition = param['table_definition']
-            if not isinstance(table_definition, TableDefinition):
-                table_def = TableDefinition.from_dict(table_definition)
-            else:
-                table_def = table_definition
-            widgets[-1].setup(table_def, param['value'])
-            layout.addWidget(widgets[-1])
-            widgets[-1].data_changed.connect(lambda: self.do_param_widgets(param_name))
-            widgets[-1].data_changed.connect(lambda: self.on_end_do_param_widgets())
-            widgets[-1].setAccessibleName(param_name)
-            value_widget = widgets[-1]
-            value_setter = widgets[-1].set_values
-            value_getter = widgets[-1].get_values
-            is_file_argument = False
+        value_widget, value_setter, value_getter, value_action, is_file_argument, select_folder = builder(
+            self, layout, param, widgets
+        )
+
+        self.param_dict[param_name] = _ParamEntry(
+            param, value_widget, value_getter, value_setter, widgets, is_file_argument, file_filter, default_suffix,
+            select_folder, value_action
+        )
+
+    def _connect_value_changed(self, signal, param_name):
+        """Connects a widget's value changed signal so the param gets updated.
+
+        Args:
+            signal: The widget signal emitted when the user changes the value.
+            param_name (str): Name of the parameter.
+        """
+        signal.connect(_weak_slot(self.do_param_widgets, param_name))
+        signal.connect(self.on_end_do_param_widgets)
+
+    def _on_file_button_clicked(self, param_name, save):
+        """Shows the file dialog for a file or folder param.
+
+        Args:
+            param_name (str): Name of the parameter.
+            save (bool): True to show a save as dialog, else an open dialog.
+        """
+        label = self.param_dict[param_name].value_widget
+        if save:
+            self.do_save_as_selector(param_name, label)
         else:
-            raise RuntimeError(f'Unsupported "param" parameter type: {ptype}')
+            self.do_open_selector(param_name, label)
+
+    def _add_string_selector(self, layout, param, widgets):
+        """Adds the widgets for a 'StringSelector' param. See add_param.
+
+        Args:
+            layout: The layout to append to
+            param: The param object
+            widgets (list[QWidget]): The param's widgets, which this appends to.
+
+        Returns:
+            (tuple): value_widget, value_setter, value_getter, value_action, is_file_argument, select_folder
+        """
+        param_name = param['name']
+        combo_box = QComboBox()
+        widgets.append(combo_box)
+        layout.addWidget(combo_box)
+        combo_box.addItems(param['choices'])
+        self._connect_value_changed(combo_box.currentIndexChanged, param_name)
+        combo_box.setAccessibleName(param_name)
+        return combo_box, combo_box.setCurrentText, combo_box.currentText, None, False, False
+
+    def _add_number(self, layout, param, widgets):
+        """Adds the widgets for a 'Number' param. See add_param.
+
+        Args:
+            layout: The layout to append to
+            param: The param object
+            widgets (list[QWidget]): The param's widgets, which this appends to.
 
-        self.param_dict[param_name] = {
-            'parent_class': param,
-            'value_widget': value_widget,
-            'value_getter': value_getter,
-            'value_setter': value_setter,
-            'widget_list': widgets,
-            'is_file_argument': is_file_argument,
-            'file_filter': file_filter,
-            'default_suffix': default_suffix,
-            'select_folder': select_folder,
-        }
-        if value_action is not None:
-            self.param_dict[param_name]['value_action'] = value_action
+        Returns:
+            (tuple): value_widget, value_setter, value_getter, value_action, is_file_argument, select_folder
+        """
+        param_name = param['name']
+        line_edit = QLineEdit()
+        widgets.append(line_edit)
+        layout.addWidget(line_edit)
+        line_edit.setValidator(self._double_validator)
+        line_edit.installEventFilter(NumberCorrector(self))
+        self._connect_value_changed(line_edit.editingFinished, param_name)
+        line_edit.setAccessibleName(param_name)
+        value_getter = lambda: float(line_edit.text())  # noqa: E731
+        return line_edit, line_edit.setText, value_getter, None, False, False
+
+    def _add_integer(self, layout, param, widgets):
+        """Adds the widgets for an 'Integer' param. See add_param.
+
+        Args:
+            layout: The layout to append to
+            param: The param object
+            widgets (list[QWidget]): The param's widgets, which this appends to.
+
+        Returns:
+            (tuple): value_widget, value_setter, value_getter, value_action, is_file_argument, select_folder
+        """
+        param_name = param['name']
+        line_edit = QLineEdit()
+        widgets.append(line_edit)
+        layout.addWidget(line_edit)
+        line_edit.setValidator(self._int_validator)
+        self._connect_value_changed(line_edit.editingFinished, param_name)
+        line_edit.setAccessibleName(param_name)
+        value_getter = lambda: int(line_edit.text())  # noqa: E731
+        return line_edit, line_edit.setText, value_getter, None, False, False
+
+    def _add_file_selector(self, layout, param, widgets, save, select_folder):
+        """Adds the widgets for a 'SelectFile', 'SaveFile', 'SelectFolder' or 'SaveFolder' param. See add_param.
+
+        Args:
+            layout: The layout to append to
+            param: The param object
+            widgets (list[QWidget]): The param's widgets, which this appends to.
+            save (bool): True if the button shows a save as dialog, else an open dialog.
+            select_folder (bool): True if selecting a folder instead of a file.
+
+        Returns:
+            (tuple): value_widget, value_setter, value_getter, value_action, is_file_argument, select_folder
+        """
+        param_name = param['name']
+        hor_layout = QHBoxLayout()
+        layout.addLayout(hor_layout)
+        button = QPushButton('Save As...' if save else 'Select File...')
+        widgets.append(button)
+        hor_layout.addWidget(button)
+        button.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Maximum)
+        button.setAccessibleName(param_name + '_select')
+        # connect to the button click
+        label = QLabel()
+        widgets.append(label)
+        hor_layout.addWidget(label)
+        button.clicked.connect(_weak_slot(self._on_file_button_clicked, param_name, save))
+        label.setAccessibleName(param_name)
+        return label, label.setText, label.text, button, True, select_folder
+
+    def _add_string(self, layout, param, widgets):
+        """Adds the widgets for a 'String' param. See add_param.
+
+        Args:
+            layout: The layout to append to
+            param: The param object
+            widgets (list[QWidget]): The param's widgets, which this appends to.
+
+        Returns:
+            (tuple): value_widget, value_setter, value_getter, value_action, is_file_argument, select_folder
+        """
+        param_name = param['name']
+        line_edit = QLineEdit()
+        widgets.append(line_edit)
+        layout.addWidget(line_edit)
+        self._connect_value_changed(line_edit.editingFinished, param_name)
+        line_edit.setAccessibleName(param_name)
+        return line_edit, line_edit.setText, line_edit.text, None, False, False
+
+    def _add_boolean(self, layout, param, widgets):
+        """Adds the widgets for a 'Boolean' param. See add_param.
+
+        Args:
+            layout: The layout to append to
+            param: The param object
+            widgets (list[QWidget]): The param's widgets, which this appends to.
+
+        Returns:
+            (tuple): value_widget, value_setter, value_getter, value_action, is_file_argument, select_folder
+        """
+        param_name = param['name']
+        check_box = QCheckBox(param['description'])
+        widgets.append(check_box)
+        layout.addWidget(check_box)
+        self._connect_value_changed(check_box.clicked, param_name)
+        check_box.setAccessibleName(param_name)
+        return check_box, check_box.setChecked, check_box.isChecked, None, False, False
+
+    def _add_table(self, layout, param, widgets):
+        """Adds the widgets for a 'Table' param. See add_param.
+
+        Args:
+            layout: The layout to append to
+            param: The param object
+            widgets (list[QWidget]): The param's widgets, which this appends to.
+
+        Returns:
+            (tuple): value_widget, value_setter, value_getter, value_action, is_file_argument, select_folder
+        """
+        param_name = param['name']
+        table = TableWithToolBar()
+        widgets.append(table)
+        table_definition = param['table_definition']
+        if not isinstance(table_definition, TableDefinition):
+            table_def = TableDefinition.from_dict(table_definition)
+        else:
+            table_def = table_definition
+        table.setup(table_def, param['value'])
+        layout.addWidget(table)
+        self._connect_value_changed(table.data_changed, param_name)
+        table.setAccessibleName(param_name)
+        return table, table.set_values, table.get_values, None, False, False
 
     def do_save_as_selector(self, param_name, file_edit_field):
         """Display a file save as dialog.
@@ -244,23 +384,23 @@ class ParamQtHelper(QObject):
             file_edit_field (QLineEdit): Qt widget holding descriptive text
         """
         p_dict = self.param_dict[param_name]
-        curr_filename = p_dict['value_getter']()
+        curr_filename = p_dict.value_getter()
         path = ''
         if curr_filename:
             path = os.path.dirname(curr_filename)
         if not os.path.exists(path):
             path = settings.get_file_browser_directory()
-        file_filter = p_dict['file_filter']
-        window_text = 'Save Folder' if p_dict['select_folder'] else 'Save File'
+        file_filter = p_dict.file_filter
+        window_text = 'Save Folder' if p_dict.select_folder else 'Save File'
         dlg = QFileDialog(self.parent_dialog, window_text, path, file_filter)
         dlg.setLabelText(QFileDialog.Accept, "Save")
         dlg.setFileMode(QFileDialog.AnyFile)
-        dlg.setDefaultSuffix(p_dict['default_suffix'])
-        if p_dict['select_folder']:
+        dlg.setDefaultSuffix(p_dict.default_suffix)
+        if p_dict.select_folder:
             dlg.setOption(QFileDialog.ShowDirsOnly, on=True)
             dlg.setFileMode(QFileDialog.Directory)
         if dlg.exec():
-            p_dict['value'] = dlg.selectedFiles()[0]
+            p_dict.parent_class['value'] = dlg.selectedFiles()[0]
             file_edit_field.setText(dlg.selectedFiles()[0])
         self.do_param_widgets(param_name)
         self.on_end_do_param_widgets()
@@ -273,21 +413,21 @@ class ParamQtHelper(QObject):
             file_edit_field (QLineEdit): Qt widget holding descriptive text
         """
         p_dict = self.param_dict[param_name]
-        curr_filename = p_dict['value_getter']()
+        curr_filename = p_dict.value_getter()
         path = ''
         if curr_filename:
             path = os.path.dirname(curr_filename)
         if not os.path.exists(path):
             path = settings.get_file_browser_directory()
-        file_filter = p_dict['file_filter']
-        window_text = 'Select Folder' if p_dict['select_folder'] else 'Select File'
+        file_filter = p_dict.file_filter
+        window_text = 'Select Folder' if p_dict.select_folder else 'Select File'
         dlg = QFileDialog(self.parent_dialog, window_text, path, file_filter)
         dlg.setLabelText(QFileDialog.Accept, "Select")
-        if p_dict['select_folder']:
+        if p_dict.select_folder:
             dlg.setOption(QFileDialog.ShowDirsOnly, on=True)
             dlg.setFileMode(QFileDialog.Directory)
         if dlg.exec():
-            p_dict['parent_class']['value'] = dlg.selectedFiles()[0]
+            p_dict.parent_class['value'] = dlg.selectedFiles()[0]
             file_edit_field.setText(dlg.selectedFiles()[0])
         self.do_param_widgets(param_name)
         self.on_end_do_param_widgets()
@@ -302,27 +442,24 @@ class ParamQtHelper(QObject):
         Args:
             param_name: Name of the parameter
         """
-        if self.do_param_widgets_call_count > 0:
-            return
-        self.do_param_widgets_call_count += 1
-
         if param_name is not None:
             p_dict = self.param_dict[param_name]
             # get the value for this parameter for its widget and set it in the param class
-            val = p_dict['value_getter']()
-            if not isinstance(val, pd.DataFrame) and val == self.NO_FILE_SELECTED and p_dict['is_file_argument']:
+            val = p_dict.value_getter()
+            if isinstance(val, str) and val == self.NO_FILE_SELECTED and p_dict.is_file_argument:
                 val = ''
-            p_dict['parent_class']['value'] = val
+            p_dict.parent_class['value'] = val
+            self.widget_values[param_name] = val
 
         # setting a param value can trigger changes to other members of the class so we need
-        # to set the values of the other params to the widgets
-        for name in self.param_dict.keys():
+        # to set the values of the other params to the widgets. Only the ones whose value changed need updating.
+        for name, p_dict in self.param_dict.items():
             if name == param_name:
                 continue
+            if name in self.widget_values and _same_value(self.widget_values[name], p_dict.parent_class['value']):
+                continue
             self._set_param_widget_value(name)
 
-        self.do_param_widgets_call_count -= 1
-
     def _set_param_widget_value(self, param_name):
         """Sets widgets for a param object.
 
@@ -330,10 +467,81 @@ class ParamQtHelper(QObject):
             param_name: Name of the parameter
         """
         p_dict = self.param_dict[param_name]
-        val = p_dict['parent_class']['value']
-        if p_dict['parent_class']['type'] in ['Number', 'Integer']:
+        val = p_dict.parent_class['value']
+        self.widget_values[param_name] = val
+        if p_dict.value_setter is None:
+            return
+        if p_dict.is_file_argument and not val:
+            val = self.NO_FILE_SELECTED
+        if self._widget_shows_value(p_dict, val):
+            return  # Setting it again would just reset things like the cursor position
+        if p_dict.parent_class['type'] in ['Number', 'Integer']:
             val = str(val)
-        if p_dict['is_file_argument'] and not val:
-            p_dict['value_setter'](self.NO_FILE_SELECTED)
-        elif p_dict['value_setter'] is not None:
-            p_dict['value_setter'](val)
+        # Block the widget's signals so setting its value doesn't call do_param_widgets again
+        with QSignalBlocker(p_dict.value_widget):
+            p_dict.value_setter(val)
+
+    @staticmethod
+    def _widget_shows_value(p_dict, val) -> bool:
+        """Returns True if the param's widget already shows the value.
+
+        Args:
+            p_dict (_ParamEntry): The param's entry in param_dict.
+            val: The value to show.
+        """
+        if not isinstance(val, (bool, int, float, str)):
+            return False  # Reading widgets like tables is costly, and the values can't be compared anyway
+        try:
+            shown = p_dict.value_getter()
+        except ValueError:  # Number and Integer edit fields that don't hold a number
+            return False
+        return _same_value(shown, val)
+
+
+# Param type -> ParamQtHelper method that adds the widgets for that type of param. See ParamQtHelper.add_param.
+_PARAM_BUILDERS = {
+    'StringSelector': ParamQtHelper._add_string_selector,
+    'Number': ParamQtHelper._add_number,
+    'Integer': ParamQtHelper._add_integer,
+    'SelectFile': partial(ParamQtHelper._add_file_selector, save=False, select_folder=False),
+    'SaveFile': partial(ParamQtHelper._add_file_selector, save=True, select_folder=False),
+    'SelectFolder': partial(ParamQtHelper._add_file_selector, save=False, select_folder=True),
+    'SaveFolder': partial(ParamQtHelper._add_file_selector, save=True, select_folder=True),
+    'String': ParamQtHelper._add_string,
+    'Boolean': ParamQtHelper._add_boolean,
+    'Table': ParamQtHelper._add_table,
+}
+
+
+def _weak_slot(method, *args):
+    """Returns a slot that calls a bound method, without keeping the method's object alive.
+
+    Args:
+        method: The bound method.
+        *args: The arguments to call it with. Any arguments the signal sends are ignored.
+
+    Returns:
+        The slot.
+    """
+    weak_method = weakref.WeakMethod(method)
+
+    def slot(*_signal_args):
+        bound_method = weak_method()
+        if bound_method is not None:
+            bound_method(*args)
+
+    return slot
+
+
+def _same_value(old_value, new_value) -> bool:
+    """Returns True if a param value is known to be unchanged, so its widget doesn't need to be set again.
+
+    Args:
+        old_value: The value last shown in the widget.
+        new_value: The current param value.
+    """
+    if new_value is None:
+        return old_value is None
+    if type(old_value) is not type(new_value) or not isinstance(new_value, (bool, int, float, str)):
+        return False  # Mutable values like DataFrames and lists may have been changed in place
+    return old_value == new_value
@@ -1,9 +1,9 @@
 """Runs XMS DMI component ActionRequest events."""
 # 1. Standard python modules
-import argparse
 from pathlib import Path
 import sys
 import traceback
+from types import SimpleNamespace
 from typing import List
 
 # 2. Third party modules
@@ -19,20 +19,44 @@ try:
 except ImportError:
     win_gui = None
 from xms.guipy.dialogs.xms_parent_dlg import ensure_qapplication_exists, get_parent_window_container
-from xms.tool_gui.tool_dialog import run_tool_dialog
+from xms.tool_gui.tool_dialog import load_class, run_tool_dialog
 
 # 4. Local modules
 
 
-def parse_arguments(args: List[str]) -> argparse.Namespace:
+def parse_arguments(args: List[str]) -> SimpleNamespace:
     """Parse arguments for running tool.
 
     Args:
         args (List[str]): The arguments.
 
     Returns:
-        (argparse.Namespace): The parsed arguments.
+        (SimpleNamespace): The parsed arguments.
     """
+    # XMS always passes the same positional arguments, so only bring in argparse for help and errors
+    if 5 <= len(args) <= 7 and '-h' not in args and '--help' not in args:
+        try:
+            ids = [int(arg) for arg in args[5:]]
+        except ValueError:
+            pass
+        else:
+            ids += [None] * (7 - len(args))
+            script, module_name, class_name, input_file, output_file = args[:5]
+            return SimpleNamespace(script=script, module_name=module_name, class_name=class_name,
+                                   input_file=input_file, output_file=output_file, modal_id=ids[0], main_id=ids[1])
+    return _parse_arguments_with_argparse(args)
+
+
+def _parse_arguments_with_argparse(args: List[str]) -> SimpleNamespace:
+    """Parse arguments for running tool with argparse, which also handles help and bad arguments.
+
+    Args:
+        args (List[str]): The arguments.
+
+    Returns:
+        (SimpleNamespace): The parsed arguments.
+    """
+    import argparse
     arguments = argparse.ArgumentParser(description="Component method runner.")
     arguments.add_argument(dest='script', type=str, help='script to run')
     arguments.add_argument(dest='module_name', type=str, help='module of the method to run')
@@ -42,7 +66,7 @@ def parse_arguments(args: List[str]) -> argparse.Namespace:
     arguments.add_argument(dest='modal_id', type=int, nargs='?', help='modal id of the parent Qt widget')
     arguments.add_argument(dest='main_id', type=int, nargs='?', help='main frame id of XMS')
     parsed_args = arguments.parse_args(args)
-    return parsed_args
+    return SimpleNamespace(**vars(parsed_args))
 
 
 def main(args):  # noqa: C901
@@ -64,8 +88,7 @@ def main(args):  # noqa: C901
 
     accepted = False
     try:
-        module = __import__(module_name, fromlist=[class_name])
-        klass = getattr(module, class_name)
+        klass = load_class(module_name, class_name)
         tool = klass()
 
         if modal_id == 0:
@@ -90,8 +113,8 @@ def main(args):  # noqa: C901
     except Exception as ex:
         temp_dir = XmsEnvironment.xms_environ_process_temp_directory()  # Creates it if needed
         debug_file_path = Path(temp_dir) / 'debug_tool_runner.txt'
-        with debug_file_path.open('w') as f:
-            traceback.print_exception(type(ex), ex, ex.__traceback__, file=f)
+        call_stack = ''.join(traceback.format_exception(type(ex), ex, ex.__traceback__))
+        debug_file_path.write_bytes(call_stack.encode('utf-8', 'replace'))
 
     if query is not None:
         query._impl._instance.SetAllowSend(True)
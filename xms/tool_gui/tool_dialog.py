@@ -1,24 +1,22 @@
 """ToolDialog class."""
 
 # 1. Standard python modules
+from collections import deque
 import datetime
+from functools import lru_cache
+import importlib
 import os
 import traceback
 from typing import List, Optional
-import webbrowser
 
 # 2. Third party modules
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QCoreApplication, Qt
 from PySide6.QtGui import QIcon
-from PySide6.QtWebEngineCore import QWebEnginePage
-from PySide6.QtWebEngineWidgets import QWebEngineView
-from PySide6.QtWidgets import (QDialog, QDialogButtonBox, QHBoxLayout, QScrollArea, QSplitter, QToolBar, QVBoxLayout,
-                               QWidget)
+from PySide6.QtWidgets import (QDialog, QDialogButtonBox, QHBoxLayout, QScrollArea, QSplitter, QTextBrowser, QToolBar,
+                               QVBoxLayout, QWidget)
 
 # 3. Aquaveo modules
 from xms.guipy.dialogs.message_box import message_with_ok
-from xms.guipy.dialogs.process_feedback_dlg import ProcessFeedbackDlg
-from xms.guipy.dialogs.process_feedback_thread import ProcessFeedbackThread
 from xms.guipy.dialogs.xms_parent_dlg import ensure_qapplication_exists, get_xms_icon, XmsDlg
 from xms.guipy.resources.help_finder import HelpFinder
 from xms.guipy.widgets.widget_builder import setup_toolbar
@@ -30,6 +28,27 @@ from xms.tool_gui.param_qt_helper import ParamQtHelper
 __copyright__ = "(C) Copyright Aquaveo 2020"
 __license__ = "All rights reserved"
 
+# Description pane HTML. Formatted with the title and description (and the URL for _ERROR_HTML).
+_DEFAULT_HTML = (
+    '<!DOCTYPE html><html><body>'
+    '<h1 style="color:blue;">{0}</h1>'
+    '<p style="color:black;">{1}</p>'
+    '</body></html>'
+)
+_ERROR_HTML = (
+    '<!DOCTYPE html><html><head><title>Use Help Button</title></head><body>'
+    '<h1 style="color:blue;">{0}</h1>'
+    '<p style="color:red;">Loading web content failed: {1}</p>'
+    '<p style="color:black;">{2}</p>'
+    '<p style="color:black;">Use the Help button to load help page in a web browser.{1}</p>'
+    '</body></html>'
+)
+
+# QtWebEngine isn't imported until a dialog needs it (see _qtwebengine). Importing it after the QApplication exists
+# requires this attribute to have been set before the QApplication was created.
+if QCoreApplication.instance() is None:
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+
 
 class ToolDialog(XmsDlg):
     """Dialog for entering values for tool arguments."""
@@ -54,6 +73,7 @@ class ToolDialog(XmsDlg):
         self.tool_arguments = tool_arguments
         self.tool_interface = ToolInterface(tool_arguments)
         self.interface_values = []
+        self.updating_arguments = False  # True while _on_argument_changed is updating the argument widgets
         self.web_page = None
         self.web_page_loaded = False
         self.web_load_error = False
@@ -75,8 +95,12 @@ class ToolDialog(XmsDlg):
         else:
             self.setWindowTitle('Tool')
         self.set_up_ui()
-        self.adjustSize()
-        self.resize(self.size().width() * 1.5, self.size().height())
+        size = self.sizeHint()
+        size.setWidth(int(size.width() * 1.5))
+        screen = self.screen()
+        if screen is not None:  # Keep the dialog on the screen, as adjustSize() did
+            size = size.boundedTo(screen.availableGeometry().size())
+        self.resize(size)
         self._on_argument_changed(force_change=True)
 
     def _set_up_param_helper(self, tool_arguments):
@@ -104,10 +128,9 @@ class ToolDialog(XmsDlg):
         self._set_layout('', 'top_layout', QVBoxLayout())
         self.widgets['h_layout'] = QHBoxLayout()
 
-        self._set_up_ui_arguments()
-
-        # Set up the description pane
+        # Set up the description pane first so the help page starts loading before the argument widgets are built
         self._add_web_view()
+        self._set_up_ui_arguments()
         self.add_splitter()
 
         self.widgets['h_layout'].addWidget(self.widgets['splitter'])
@@ -116,9 +139,6 @@ class ToolDialog(XmsDlg):
 
         self.widgets['top_layout'].addWidget(self.widgets['btn_box'])
 
-        # set all widget values and hide/show
-        self.param_helper.do_param_widgets(None)
-
         # QDialogButtonBox with Ok and Cancel buttons
         self.widgets['btn_box'].setOrientation(Qt.Horizontal)
         self.widgets['btn_box'].setStandardButtons(
@@ -129,35 +149,11 @@ class ToolDialog(XmsDlg):
 
     def _default_html(self):
         """Returns the default html string for the description window."""
-        return """
-              <!DOCTYPE html>
-              <html>
-              <body>
-
-              <h1 style="color:blue;">{0}</h1>
-              <p style="color:black;">{1}</p>
-
-              </body>
-              </html>
-              """
+        return _DEFAULT_HTML
 
     def _error_html(self):
         """Returns the error html string for the description window."""
-        error_html = """
-                     <!DOCTYPE html>
-                     <html>
-                     <head>
-                     <title>Use Help Button</title>
-                     </head>
-                     <body>
-                     <h1 style="color:blue;">{0}</h1>
-                     <p style="color:red;">Loading web content failed: {1}</p>
-                     <p style="color:black;">{2}</p>
-                     <p style="color:black;">Use the Help button to load help page in a web browser.{1}</p>
-                     </body>
-                     </html>
-                     """
-        return error_html
+        return _ERROR_HTML
 
     def _on_web_page_loaded(self, loaded):
         """Set the description to the tool web page once it loads.
@@ -200,29 +196,54 @@ class ToolDialog(XmsDlg):
         Args:
             force_change (bool): flag to force that the parameters have changed
         """
+        if self.updating_arguments:
+            # Clearing the old widgets can make them emit signals (like a line edit losing focus), which land here
+            return
         changed = self.tool_interface.apply_interface_values(self.interface_values)
         if changed or force_change:
-            self.tool.enable_arguments(self.tool_arguments)
-            self.interface_values = self.tool_interface.get_interface_values()
-            clear_layout(self.widgets['arg_layout'])
-            self._set_up_param_helper(self.tool_arguments)
-            self.param_helper.add_params_to_layout(self.widgets['arg_layout'], self.interface_values)
-            self.widgets['arg_layout'].addStretch()
-            self.param_helper.do_param_widgets(None)  # Get values from arguments into params
+            self.updating_arguments = True
+            try:
+                self.tool.enable_arguments(self.tool_arguments)
+                old_interface_values = self.interface_values
+                self.interface_values = self.tool_interface.get_interface_values()
+                if force_change or _param_layout(old_interface_values) != _param_layout(self.interface_values):
+                    clear_layout(self.widgets['arg_layout'])
+                    self._set_up_param_helper(self.tool_arguments)
+                    self.param_helper.add_params_to_layout(self.widgets['arg_layout'], self.interface_values)
+                    self.widgets['arg_layout'].addStretch()
+                else:  # Only values changed, so keep the widgets we have
+                    self.param_helper.update_params(self.interface_values)
+                self.param_helper.do_param_widgets(None)  # Get values from arguments into params
+            finally:
+                self.updating_arguments = False
 
     def _add_web_view(self):
         """Add the description web view pane."""
         # Create a widget to layout the navigation bar and web view.
         self.widgets['description_widget'] = QWidget()
         self._set_layout('description_widget', 'description_layout', QVBoxLayout())
-        # Create the web view. Initially has the static text defined in the tool class.
-        self.widgets['web_browser'] = QWebEngineView()
-        self.widgets['web_browser'].urlChanged.connect(self._on_url_changed)
-        self.web_page = QWebEnginePage()  # Load the URL in the background
-        self.web_page.loadFinished.connect(self._on_web_page_loaded)
-        # Back and forward navigation buttons
-        self._add_navigation_bar()
-        self.widgets['description_layout'].addWidget(self.widgets['navigation_bar'])
+        self.update_tool_help_url()
+        if self.tool_url:
+            # Create the web view. Initially has the static text defined in the tool class.
+            QWebEnginePage, QWebEngineSettings, QWebEngineView = _qtwebengine()
+            self.widgets['web_browser'] = QWebEngineView()
+            self.widgets['web_browser'].urlChanged.connect(self._on_url_changed)
+            self.web_page = QWebEnginePage(_shared_web_profile(), self)  # Load the URL in the background
+            # Help pages are static documentation, so turn off what they don't need
+            web_settings = self.web_page.settings()
+            web_settings.setAttribute(QWebEngineSettings.JavascriptEnabled, False)
+            web_settings.setAttribute(QWebEngineSettings.PluginsEnabled, False)
+            web_settings.setAttribute(QWebEngineSettings.WebGLEnabled, False)
+            web_settings.setAttribute(QWebEngineSettings.LocalStorageEnabled, False)
+            self.web_page.setBackgroundColor(Qt.white)
+            self.web_page.loadFinished.connect(self._on_web_page_loaded)
+            # Back and forward navigation buttons
+            self._add_navigation_bar()
+            self.widgets['description_layout'].addWidget(self.widgets['navigation_bar'])
+        else:
+            # Nothing to load, so the static text doesn't need a web engine
+            self.widgets['web_browser'] = QTextBrowser()
+            self.widgets['web_browser'].setOpenExternalLinks(True)
         self.widgets['description_layout'].addWidget(self.widgets['web_browser'])
         # Initialize the text in the description web view.
         self._set_up_ui_browser_initial_text()
@@ -256,7 +277,6 @@ class ToolDialog(XmsDlg):
 
     def _set_up_ui_browser_initial_text(self):
         """Set the initial test for the description pane."""
-        self.update_tool_help_url()
         title = f'{self.title} (loading web content...)' if self.tool_url else self.title
         str_html = self._default_html().format(title, self.description)
         self.widgets['web_browser'].setHtml(str_html)
@@ -266,12 +286,7 @@ class ToolDialog(XmsDlg):
     def update_tool_help_url(self):
         """Update the tool help URL used for web page and help button."""
         if self.tool_url is None:
-            self.tool_url = HelpFinder.help_url(
-                dialog_help_url='https://www.xmswiki.com/wiki/Tool_Dialog_Help',
-                identifier=self.tool_uuid,
-                default='',
-                category='xmstool'
-            )
+            self.tool_url = _cached_help_url(self.tool_uuid)
 
     def _set_up_ui_arguments(self):
         """Set up the general widgets."""
@@ -299,6 +314,7 @@ class ToolDialog(XmsDlg):
 
     def help_requested(self):
         """Called when the Help button is clicked."""
+        import webbrowser  # Only needed here, and slow to import
         if self.tool_url:
             webbrowser.open(self.tool_url)
         else:
@@ -315,7 +331,7 @@ class ToolDialog(XmsDlg):
         """
         param = self.param_helper.param_dict.get(name, None)
         if param is not None:
-            return param.get('value_widget', None)
+            return param.value_widget
         return None
 
     def get_param_widget_names(self) -> List[str]:
@@ -327,6 +343,54 @@ class ToolDialog(XmsDlg):
         return list(self.param_helper.param_dict.keys())
 
 
+@lru_cache(maxsize=256)
+def _cached_help_url(tool_uuid):
+    """Returns the help URL for a tool, only looking it up the first time it is asked for.
+
+    Call _cached_help_url.cache_clear() to look them up again.
+
+    Args:
+        tool_uuid (str): The UUID of the tool.
+
+    Returns:
+        (str): The URL, or '' if there isn't one.
+    """
+    return HelpFinder.help_url(
+        dialog_help_url='https://www.xmswiki.com/wiki/Tool_Dialog_Help',
+        identifier=tool_uuid,
+        default='',
+        category='xmstool'
+    )
+
+
+@lru_cache(maxsize=1)
+def _qtwebengine():
+    """Imports QtWebEngine the first time it is needed, since it is slow to load.
+
+    Returns:
+        (tuple): QWebEnginePage, QWebEngineSettings, QWebEngineView
+    """
+    from PySide6.QtWebEngineCore import QWebEnginePage, QWebEngineSettings
+    from PySide6.QtWebEngineWidgets import QWebEngineView
+    return QWebEnginePage, QWebEngineSettings, QWebEngineView
+
+
+@lru_cache(maxsize=1)
+def _shared_web_profile():
+    """Returns the web profile shared by all the dialogs' help pages.
+
+    The profile is off the record, so nothing is stored on disk or shared with other processes. Its HTTP cache is in
+    memory, so a help page loaded once doesn't need to be downloaded again by later dialogs.
+
+    Returns:
+        (QWebEngineProfile): The profile.
+    """
+    from PySide6.QtWebEngineCore import QWebEngineProfile
+    profile = QWebEngineProfile(QCoreApplication.instance())  # Deleted with the application
+    profile.setHttpCacheType(QWebEngineProfile.MemoryHttpCache)
+    return profile
+
+
 def clear_layout(layout, delete_widgets=True):
     """Clear all widgets under a layout.
 
@@ -334,16 +398,35 @@ def clear_layout(layout, delete_widgets=True):
         layout: The QLayout.
         delete_widgets: Should the widgets be deleted.
     """
-    item = layout.takeAt(0)
-    while item is not None:
-        if delete_widgets:
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-        child_layout = item.layout()
-        if child_layout is not None:
-            clear_layout(child_layout, delete_widgets)
+    # Widgets are moved under one parent which is deleted later, so Qt deletes them all in one event
+    trash = QWidget() if delete_widgets else None
+    layouts = deque([layout])
+    while layouts:
+        layout = layouts.popleft()
         item = layout.takeAt(0)
+        while item is not None:
+            if trash is not None:
+                widget = item.widget()
+                if widget is not None:
+                    widget.setParent(trash)
+            child_layout = item.layout()
+            if child_layout is not None:
+                layouts.append(child_layout)
+            item = layout.takeAt(0)
+    if trash is not None:
+        trash.deleteLater()
+
+
+def _param_layout(params):
+    """Returns everything about the params that determines their widgets, which is everything but their values.
+
+    Args:
+        params (list[dict]): The params, as returned by ToolInterface.get_interface_values.
+
+    Returns:
+        (list[dict]): See description.
+    """
+    return [{key: value for key, value in param.items() if key != 'value'} for param in params]
 
 
 def _override_default_arguments(tool, json_object):
@@ -360,16 +443,34 @@ def _override_default_arguments(tool, json_object):
     Returns:
         (list): List of arguments used from previous tool run.
     """
-    initial_arguments = [argument.to_dict() for argument in tool.initial_arguments()]
+    specified_arguments = {}
+    for specified_argument in json_object.get('arguments') or []:
+        specified_arguments.setdefault(specified_argument.get('name', ''), specified_argument)  # First one wins
+    arguments = tool.initial_arguments()
+    if not any(argument.name in specified_arguments for argument in arguments):
+        return arguments  # Nothing to override, so skip the round trip through dicts
+    initial_arguments = [argument.to_dict() for argument in arguments]
     for initial_argument in initial_arguments:
-        arg_name = initial_argument.get('name', '')
-        for specified_argument in json_object['arguments']:
-            if specified_argument.get('name', '') == arg_name:
-                initial_argument.update(specified_argument)
-                break
+        specified_argument = specified_arguments.get(initial_argument.get('name', ''))
+        if specified_argument is not None:
+            initial_argument.update(specified_argument)
     return tool.get_arguments_from_results({'arguments': initial_arguments})
 
 
+@lru_cache(maxsize=128)
+def load_class(module_name, class_name):
+    """Imports a module and returns a class from it.
+
+    Args:
+        module_name (str): Import path to the module
+        class_name (str): Name of the class
+
+    Returns:
+        (type): The class.
+    """
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 def _run_results_dialog(module_name, class_name, parent):
     """Run a custom, tool-defined results dialog after the tool finishes running.
 
@@ -378,8 +479,7 @@ def _run_results_dialog(module_name, class_name, parent):
         class_name (str): Class namem of the QDialog
         parent (QDialog): The parent dialog
     """
-    module = __import__(module_name, fromlist=[class_name])
-    klass = getattr(module, class_name)
+    klass = load_class(module_name, class_name)
     dlg = klass(parent)
     return dlg.exec()
 
@@ -470,6 +570,10 @@ def run_tool_with_feedback(win_cont, tool, tool_arguments, auto_str='', modal=Fa
         'use_colors': True,
         'auto_load': 'testing' if testing else auto_str
     }
+    # Only needed when a tool is actually run
+    from xms.guipy.dialogs.process_feedback_dlg import ProcessFeedbackDlg
+    from xms.guipy.dialogs.process_feedback_thread import ProcessFeedbackThread
+
     ensure_qapplication_exists()
     worker = ProcessFeedbackThread(_run_tool, None)
     feedback_dlg = ProcessFeedbackDlg(
@@ -488,6 +592,7 @@ def run_tool_with_feedback(win_cont, tool, tool_arguments, auto_str='', modal=Fa
     return dialog_result
 
 
+@lru_cache(maxsize=1)
 def get_test_files_path():
     """Returns the full path to the 'tests/files' directory.
 
@@ -1,15 +1,23 @@
 """Plotting functions."""
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from functools import lru_cache
+import hashlib
+import threading
 from typing import Optional
 
+try:
+    import bottleneck
+except ImportError:
+    bottleneck = None
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
+from matplotlib.collections import PolyCollection
 from matplotlib.figure import Figure
 import matplotlib.pyplot as pyplot
 import matplotlib.tri as tri
 import numpy
 from PySide6 import QtCore
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QSignalBlocker, Qt, QThread, QTimer, Signal
 from PySide6.QtWidgets import (QComboBox, QDialog, QDialogButtonBox, QLabel, QMainWindow, QVBoxLayout, QWidget)
 
 from xms.constraint.ugrid_activity import active_cells_from_points, CellToPointActivityCalculator
@@ -19,8 +27,19 @@ from xms.tool_core import DataHandler
 
 PlotInfo = namedtuple('PlotInfo', ['dataset', 'time_step', 'color_map'])
 
+_POLYHEDRON_CELL_TYPE = 42  # VTK_POLYHEDRON. Its cell stream entry holds faces rather than a point count.
 
-def show_dataset_plot(data_handler: DataHandler, dataset_path: str, time_step: int, color_map: str = 'cool'):
+# Bottleneck's single-pass NaN reductions are faster than numpy's when it's installed
+_nanmin = bottleneck.nanmin if bottleneck is not None else numpy.nanmin
+_nanmax = bottleneck.nanmax if bottleneck is not None else numpy.nanmax
+
+_TRIANGULATION_CACHE_SIZE = 8
+_triangulations = OrderedDict()  # Most recently used last, keyed by a digest of the triangulation's arrays
+_triangulations_lock = threading.Lock()  # Plots are built on worker threads
+
+
+def show_dataset_plot(data_handler: DataHandler, dataset_path: str, time_step: int, color_map: str = 'cool',
+                      mode: str = 'contour'):
     """Show a plot of a dataset in jupyter notebook.
 
     Args:
@@ -28,11 +47,14 @@ def show_dataset_plot(data_handler: DataHandler, dataset_path: str, time_step: i
         dataset_path: Path to the dataset starting with the project data folder.
         time_step: The dataset timestep index.
         color_map: Color map to use.
+        mode: 'contour' for filled contours, 'flat' to color each triangle with its average value, or 'pcolor' to
+            shade smoothly between the points. The last two are faster.
     """
-    _get_dataset_plot(data_handler, dataset_path, time_step, pyplot.figure(), color_map)
+    _get_dataset_plot(data_handler, dataset_path, time_step, pyplot.figure(), color_map, mode)
 
 
-def get_dataset_plot(data_handler: DataHandler, dataset_path: str, time_step: int, color_map: str = 'cool'):
+def get_dataset_plot(data_handler: DataHandler, dataset_path: str, time_step: int, color_map: str = 'cool',
+                     mode: str = 'contour'):
     """Get a plot of a dataset to be used by panel.
 
     Args:
@@ -40,45 +62,78 @@ def get_dataset_plot(data_handler: DataHandler, dataset_path: str, time_step: in
         dataset_path: Path to the dataset starting with the project data folder.
         time_step: The dataset timestep index.
         color_map: Color map to use.
+        mode: 'contour' for filled contours, 'flat' to color each triangle with its average value, or 'pcolor' to
+            shade smoothly between the points. The last two are faster.
     """
     figure = Figure(tight_layout=True)
-    return _get_dataset_plot(data_handler, dataset_path, time_step, figure, color_map)
+    return _get_dataset_plot(data_handler, dataset_path, time_step, figure, color_map, mode)
 
 
-def write_vtk_file(data_handler: DataHandler, dataset_path: str, time_step: int):
+def write_vtk_file(data_handler: DataHandler, dataset_path: str, time_step: int, binary: bool = True):
     """Write VTK file for dataset.
 
     Args:
         data_handler: The data handler.
         dataset_path: Path to the dataset starting with the project data folder.
         time_step: The dataset timestep index.
+        binary: Whether to write the data as binary, which is smaller and much faster to write, rather than ASCII.
     """
     dataset_name, dataset, ugrid = _load_dataset(data_handler, dataset_path)
     point_values, hidden_cells, _ = _read_dataset_values(dataset, ugrid, time_step)
     x, y, triangles, masked = _get_contour_triangles(ugrid, hidden_cells)
+    points = numpy.column_stack((x, y, numpy.zeros_like(x)))
+    visible_triangles = triangles[~masked]
+    polygons = numpy.empty((len(visible_triangles), 4), dtype=numpy.int64)
+    polygons[:, 0] = 3
+    polygons[:, 1:] = visible_triangles
     header = ('# vtk DataFile Version 4.0\n'
               'vtk output\n'
-              'ASCII\n'
+              f'{"BINARY" if binary else "ASCII"}\n'
               'DATASET POLYDATA\n')
-    with open(f'{dataset_path}_{time_step}.vtk', 'w') as f:
-        f.write(header)
-        f.write(f'POINTS {len(point_values)} double\n')
-        for i in range(len(x)):
-            f.write(f'{x[i]} {y[i]} 0.0\n')
-        visible_tri_count = len(masked) - numpy.count_nonzero(masked)
-        f.write(f'POLYGONS {visible_tri_count} {visible_tri_count * 4}\n')
-        for i in range(len(triangles)):
-            if not masked[i]:
-                t = triangles[i]
-                f.write(f'3 {t[0]} {t[1]} {t[2]}\n')
-        f.write(f'\nPOINT_DATA {len(point_values)}\n')
-        f.write('SCALARS point_values double 1\n')
-        f.write('LOOKUP_TABLE default\n')
-        for value in point_values:
-            f.write(f'{value}\n')
-
-
-def _get_dataset_plot(data_handler, dataset_path, time_step, figure, color_map):
+    with open(f'{dataset_path}_{time_step}.vtk', 'wb') as f:
+        f.write(header.encode())
+        f.write(f'POINTS {len(point_values)} double\n'.encode())
+        f.write(_vtk_data(points, '>f8', '%r %r %r\n', binary))
+        f.write(f'POLYGONS {len(polygons)} {polygons.size}\n'.encode())
+        f.write(_vtk_data(polygons, '>i4', '%d %d %d %d\n', binary))
+        f.write(f'\nPOINT_DATA {len(point_values)}\n'.encode())
+        f.write(b'SCALARS point_values double 1\n')
+        f.write(b'LOOKUP_TABLE default\n')
+        f.write(_vtk_data(point_values, '>f8', '%r\n', binary))
+
+
+def _vtk_data(values, binary_type: str, row_format: str, binary: bool) -> bytes:
+    """Get the contents of a section of a legacy VTK file.
+
+    Args:
+        values: The array to write.
+        binary_type: The numpy type to write the values as in a binary file. VTK expects big-endian data.
+        row_format: The %-style format for one row of the values in an ASCII file.
+        binary: Whether the file is binary.
+
+    Returns:
+        The section's contents.
+    """
+    if binary:
+        return numpy.ascontiguousarray(values, dtype=binary_type).tobytes() + b'\n'
+    return _format_rows(row_format, values).encode()
+
+
+def _format_rows(row_format: str, values) -> str:
+    """Formats every row of an array with one % operation rather than one per row.
+
+    Args:
+        row_format: The %-style format for one row. Use %r for floats to get the same text as str().
+        values: The array. Each row must have as many values as row_format has fields.
+
+    Returns:
+        The formatted rows, concatenated.
+    """
+    values = numpy.asarray(values)
+    return (row_format * len(values)) % tuple(values.ravel().tolist())
+
+
+def _get_dataset_plot(data_handler, dataset_path, time_step, figure, color_map, mode='contour'):
     """Get a plot of a dataset.
 
     Args:
@@ -87,11 +142,12 @@ def _get_dataset_plot(data_handler, dataset_path, time_step, figure, color_map):
         time_step: The dataset timestep index.
         figure: The figure to plot the dataset into.
         color_map: The colormap to use.
+        mode: The kind of plot. See _contour_plot.
     """
     dataset_name, dataset, ugrid = _load_dataset(data_handler, dataset_path)
     point_values, hidden_cells, range = _read_dataset_values(dataset, ugrid, time_step)
     x, y, triangles, mask = _get_contour_triangles(ugrid, hidden_cells)
-    return _contour_plot(figure, dataset_name, x, y, point_values, triangles, mask, color_map, range)
+    return _contour_plot(figure, dataset_name, x, y, point_values, triangles, mask, color_map, range, mode)
 
 
 def _load_dataset(data_handler: DataHandler, dataset_path: str):
@@ -125,19 +181,57 @@ def _read_dataset_values(dataset: DatasetReader, ugrid: UGrid, time_step: int):
     """
     if dataset.activity is not None and dataset.values.shape != dataset.activity.shape:
         dataset.activity_calculator = CellToPointActivityCalculator(ugrid)
-    overall_min = float('inf')
-    overall_max = float('-inf')
-    for step_idx in range(dataset.num_times):
-        point_values, activity = dataset.timestep_with_activity(step_idx, nan_activity=True)
-        overall_min = min((overall_min, numpy.nanmin(point_values)))
-        overall_max = max((overall_max, numpy.nanmax(point_values)))
-    point_values, activity = dataset.timestep_with_activity(time_step, nan_activity=True)
-    if activity is None or activity.shape == point_values.shape:
-        activity = active_cells_from_points(ugrid, ~numpy.isnan(point_values))
-    hidden_cells = activity == 0
-    min_value = numpy.nanmin(point_values)
-    point_values[numpy.isnan(point_values)] = min_value
-    return point_values, hidden_cells, (overall_min, overall_max)
+    overall_range = _get_stored_range(dataset)
+    requested_step = None
+    if overall_range is None:
+        overall_min = float('inf')
+        overall_max = float('-inf')
+        for step_idx in range(dataset.num_times):
+            step = dataset.timestep_with_activity(step_idx, nan_activity=True)
+            step_values = step[0][~numpy.isnan(step[0])]
+            if step_values.size:
+                overall_min = min((overall_min, step_values.min()))
+                overall_max = max((overall_max, step_values.max()))
+            if step_idx == time_step:
+                requested_step = step
+        overall_range = (overall_min, overall_max)
+    if requested_step is None:
+        requested_step = dataset.timestep_with_activity(time_step, nan_activity=True)
+    point_values, activity = requested_step
+    nan_points = numpy.isnan(point_values)
+    if activity is not None and activity.shape != point_values.shape:
+        hidden_cells = activity == 0  # Already per cell
+    elif nan_points.any():
+        hidden_cells = active_cells_from_points(ugrid, ~nan_points) == 0
+    else:
+        hidden_cells = numpy.zeros(ugrid.cell_count, dtype=bool)  # Every point is active, so every cell is too
+    point_values[nan_points] = _nanmin(point_values)
+    return point_values, hidden_cells, overall_range
+
+
+def _get_stored_range(dataset: DatasetReader):
+    """Get the dataset's range over all time steps from the minimums and maximums stored with it.
+
+    The stored values can include inactive and null values, which the plot leaves out, so they are only used for
+    datasets without activity or a null value.
+
+    Args:
+        dataset: The dataset reader.
+
+    Returns:
+        A tuple containing the minimum and maximum, or None if the dataset doesn't have usable ones.
+    """
+    if dataset.activity is not None or getattr(dataset, 'null_value', None) is not None:
+        return None
+    mins = getattr(dataset, 'mins', None)
+    maxs = getattr(dataset, 'maxs', None)
+    if mins is None or maxs is None:
+        return None
+    mins = numpy.asarray(mins[()], dtype=float)
+    maxs = numpy.asarray(maxs[()], dtype=float)
+    if mins.shape != (dataset.num_times,) or maxs.shape != (dataset.num_times,) or numpy.isnan(mins).all():
+        return None
+    return _nanmin(mins), _nanmax(maxs)
 
 
 def _get_contour_triangles(ugrid, hidden_cells):
@@ -150,36 +244,97 @@ def _get_contour_triangles(ugrid, hidden_cells):
     Returns:
         A tuple containing the x locations, y locations, triangles, and hidden mask.
     """
-    locations = numpy.array(ugrid.locations)
+    locations = numpy.asarray(ugrid.locations)
     x = locations[:, 0]
     y = locations[:, 1]
 
-    triangles = []
-    grid_indices = []
-    for cell_index in range(ugrid.cell_count):
+    triangles, grid_indices = _get_cell_triangles(ugrid)
+    mask = numpy.asarray(hidden_cells)[grid_indices]
+    return x, y, triangles, mask
+
+
+def _get_cell_triangles(ugrid):
+    """Splits the UGrid's cells with three or four points into triangles.
+
+    Args:
+        ugrid: The UGrid.
+
+    Returns:
+        A tuple containing the triangles' point indices and the index of the cell each triangle came from.
+    """
+    # Grids with only triangles or only quadrilaterals (the usual case) can be split straight from the cell stream
+    cell_count = ugrid.cell_count
+    cellstream = numpy.asarray(ugrid.cellstream, dtype=numpy.int64)
+    for point_count in (3, 4):
+        stride = point_count + 2  # Cell type, point count, points
+        if (len(cellstream) == cell_count * stride and numpy.all(cellstream[1::stride] == point_count)
+                and numpy.all(cellstream[0::stride] != _POLYHEDRON_CELL_TYPE)):
+            cell_points = cellstream.reshape(cell_count, stride)[:, 2:]
+            grid_indices = numpy.arange(cell_count)
+            if point_count == 3:
+                return cell_points, grid_indices
+            triangles = numpy.empty((2 * cell_count, 3), dtype=numpy.int64)
+            triangles[0::2] = cell_points[:, [0, 1, 2]]
+            triangles[1::2] = cell_points[:, [2, 3, 0]]
+            return triangles, numpy.repeat(grid_indices, 2)
+
+    # Mixed cell sizes: find where each cell starts in the cell stream, then split them all at once
+    cell_starts = _get_cell_starts(cellstream, cell_count)
+    if cell_starts is not None:
+        point_counts = cellstream[cell_starts + 1]
+        cell_triangle_counts = numpy.where(point_counts == 3, 1, 0) + numpy.where(point_counts == 4, 2, 0)
+        first_triangles = numpy.cumsum(cell_triangle_counts) - cell_triangle_counts
+        triangles = numpy.empty((cell_triangle_counts.sum(), 3), dtype=numpy.int64)
+        tri_cells = numpy.flatnonzero(point_counts == 3)
+        triangles[first_triangles[tri_cells]] = cellstream[cell_starts[tri_cells, None] + [2, 3, 4]]
+        quad_cells = numpy.flatnonzero(point_counts == 4)
+        quad_points = cellstream[cell_starts[quad_cells, None] + [2, 3, 4, 5]]
+        triangles[first_triangles[quad_cells]] = quad_points[:, [0, 1, 2]]
+        triangles[first_triangles[quad_cells] + 1] = quad_points[:, [2, 3, 0]]
+        return triangles, numpy.repeat(numpy.arange(cell_count), cell_triangle_counts)
+
+    # Polyhedra: ask the UGrid for each cell's points. A cell makes at most two triangles, so fill a big enough array.
+    triangles = numpy.empty((2 * cell_count, 3), dtype=numpy.int64)
+    grid_indices = numpy.empty(2 * cell_count, dtype=numpy.int64)
+    triangle_count = 0
+    for cell_index in range(cell_count):
         cell_points = ugrid.get_cell_points(cell_index)
         cell_point_count = len(cell_points)
         if cell_point_count == 3:
-            pt0 = cell_points[0]
-            pt1 = cell_points[1]
-            pt2 = cell_points[2]
-            triangles.append([pt0, pt1, pt2])
-            grid_indices.append(cell_index)
+            triangles[triangle_count] = cell_points
+            grid_indices[triangle_count] = cell_index
+            triangle_count += 1
         elif cell_point_count == 4:
-            pt0 = cell_points[0]
-            pt1 = cell_points[1]
-            pt2 = cell_points[2]
-            pt3 = cell_points[3]
-            triangles.append([pt0, pt1, pt2])
-            triangles.append([pt2, pt3, pt0])
-            grid_indices.extend((cell_index, cell_index))
-    triangles = numpy.array(triangles)
-    mask = [hidden_cells[grid_indices[tri_index]] for tri_index in range(len(grid_indices))]
-    mask = numpy.array(mask)
-    return x, y, triangles, mask
+            triangles[triangle_count] = cell_points[0], cell_points[1], cell_points[2]
+            triangles[triangle_count + 1] = cell_points[2], cell_points[3], cell_points[0]
+            grid_indices[triangle_count:triangle_count + 2] = cell_index
+            triangle_count += 2
+    return triangles[:triangle_count], grid_indices[:triangle_count]
+
 
+def _get_cell_starts(cellstream, cell_count: int):
+    """Get where each cell starts in a UGrid cell stream.
 
-def _contour_plot(figure, title, x, y, point_values, triangles, mask, color_map, range):
+    Args:
+        cellstream: The cell stream.
+        cell_count: The number of cells.
+
+    Returns:
+        The start index of each cell, or None if the grid has polyhedra, whose entries can't be stepped over the same
+        way.
+    """
+    stream = cellstream.tolist()  # Python ints are faster to walk than numpy elements
+    cell_starts = [0] * cell_count
+    position = 0
+    for cell_index in range(cell_count):
+        if stream[position] == _POLYHEDRON_CELL_TYPE:
+            return None
+        cell_starts[cell_index] = position
+        position += 2 + stream[position + 1]
+    return numpy.array(cell_starts, dtype=numpy.int64)
+
+
+def _contour_plot(figure, title, x, y, point_values, triangles, mask, color_map, range, mode='contour'):
     """Get a contour plot of the values.
 
     Args:
@@ -192,11 +347,15 @@ def _contour_plot(figure, title, x, y, point_values, triangles, mask, color_map,
         mask: Mask for the hidden triangles.
         color_map: Color map to use.
         range: The range to show the contour plot.
+        mode: 'contour' for filled contours, 'flat' to color each triangle with the average of its point values, or
+            'pcolor' to shade smoothly between the point values. Flat and pcolor plots skip the contouring, so they are
+            much faster to build for large grids.
 
     Returns:
         A contour plot of the values.
     """
-    triangulation = tri.Triangulation(x, y, triangles=triangles, mask=mask)
+    if mode not in ('contour', 'flat', 'pcolor'):
+        raise ValueError(f'Unknown plot mode: {mode}')
     axes = figure.subplots()
     axes.set_aspect('equal')
     min_range, max_range = range
@@ -204,30 +363,158 @@ def _contour_plot(figure, title, x, y, point_values, triangles, mask, color_map,
         min_range -= 10
         max_range += 10
     num_levels = 11
-    levels = numpy.linspace(min_range, max_range, num_levels)
-    tri_contour_set = axes.tricontourf(triangulation, point_values, levels=levels, cmap=color_map)
-    figure.colorbar(tri_contour_set)
+    if mode == 'flat':
+        visible_triangles = triangles[~mask]
+        vertices = numpy.column_stack((x, y))[visible_triangles]
+        triangle_values = point_values[visible_triangles].mean(axis=1)
+        collection = PolyCollection(vertices, array=triangle_values, cmap=color_map, edgecolors='face')
+        collection.set_clim(min_range, max_range)
+        axes.margins(0)
+        axes.add_collection(collection)
+        axes.autoscale_view()
+        figure.colorbar(collection)
+    elif mode == 'pcolor':
+        triangulation = _get_triangulation(x, y, triangles, mask)
+        axes.margins(0)
+        tri_mesh = axes.tripcolor(triangulation, point_values, shading='gouraud', cmap=color_map, vmin=min_range,
+                                  vmax=max_range)
+        figure.colorbar(tri_mesh)
+    else:
+        triangulation = _get_triangulation(x, y, triangles, mask)
+        levels = numpy.linspace(min_range, max_range, num_levels)
+        tri_contour_set = axes.tricontourf(triangulation, point_values, levels=levels, cmap=color_map)
+        figure.colorbar(tri_contour_set)
     axes.set_title(title)
     axes.set_xlabel('X location')
     axes.set_ylabel('Y location')
     return figure
 
 
+def _get_triangulation(x, y, triangles, mask):
+    """Get a triangulation, reusing the one from an earlier plot of the same grid and activity.
+
+    Plots of different time steps of a dataset, or of different datasets on the same grid, usually have identical
+    triangulations. Keying on the array contents rather than the UGrid means it still works when the grid is read
+    again for each plot.
+
+    Args:
+        x: The X point locations.
+        y: The Y point locations.
+        triangles: The triangles.
+        mask: Mask for the hidden triangles.
+
+    Returns:
+        The triangulation.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in (x, y, triangles, mask):
+        array = numpy.ascontiguousarray(array)
+        digest.update(f'{array.dtype.str}{array.shape}'.encode())
+        digest.update(array.data)
+    key = digest.digest()
+    with _triangulations_lock:
+        triangulation = _triangulations.pop(key, None)
+        if triangulation is None:
+            triangulation = tri.Triangulation(x, y, triangles=triangles, mask=mask)
+            # Build the C++ triangulation now, since it is built lazily and the triangulation is shared by threads
+            triangulation.get_cpp_triangulation()
+        _triangulations[key] = triangulation
+        while len(_triangulations) > _TRIANGULATION_CACHE_SIZE:
+            _triangulations.popitem(last=False)
+    return triangulation
+
+
+@lru_cache(maxsize=1)
+def _sorted_color_maps() -> list[str]:
+    """Get the names of the matplotlib color maps, sorted case-insensitively.
+
+    Returns:
+        The color map names.
+    """
+    return sorted(pyplot.colormaps(), key=str.lower)
+
+
 class PlotCanvas(FigureCanvas):
     """Plotting canvas for displaying dataset."""
 
-    def __init__(self, data_handler: DataHandler, dataset_path: str, time_step: int, color_map: str):
+    def __init__(self, data_handler: Optional[DataHandler] = None, dataset_path: str = '', time_step: int = 0,
+                 color_map: str = 'cool', figure: Optional[Figure] = None):
         """
         Initialize the object.
 
+        The dataset is plotted right away, which blocks until it is done. Use build_async() to plot it on a worker
+        thread instead.
+
         Args:
             data_handler: The data handler.
             dataset_path: The path to the dataset.
             time_step: The dataset time step.
             color_map: Color map to use.
+            figure: The dataset's plot, from get_dataset_plot, if it has already been made. The other arguments are
+                ignored when this is given.
+        """
+        if figure is None:
+            figure = get_dataset_plot(data_handler, dataset_path, time_step, color_map)
+        super().__init__(figure)
+
+    @classmethod
+    def build_async(cls, data_handler: DataHandler, dataset_path: str, time_step: int, color_map: str, callback,
+                    error_callback=None, parent: Optional[QWidget] = None) -> QThread:
+        """Build a canvas for a dataset without blocking the GUI thread.
+
+        The dataset is read and plotted on a worker thread. The canvas itself is made on the GUI thread.
+
+        Args:
+            data_handler: The data handler. It shouldn't be used elsewhere until the plot is done.
+            dataset_path: The path to the dataset.
+            time_step: The dataset time step.
+            color_map: Color map to use.
+            callback: Called with the new PlotCanvas when it is ready.
+            error_callback: Called with the error message if the plot couldn't be made.
+            parent: The parent of the worker thread. It must outlive the thread.
+
+        Returns:
+            The worker thread, which has already been started.
         """
-        fig = get_dataset_plot(data_handler, dataset_path, time_step, color_map)
-        super().__init__(fig)
+        thread = _PlotThread(data_handler, dataset_path, time_step, color_map, parent)
+        thread.plot_built.connect(lambda figure: callback(cls(figure=figure)))
+        if error_callback is not None:
+            thread.plot_failed.connect(error_callback)
+        thread.start()
+        return thread
+
+
+class _PlotThread(QThread):
+    """Worker thread that reads a dataset and plots it into a figure."""
+
+    plot_built = Signal(object)
+    plot_failed = Signal(str)
+
+    def __init__(self, data_handler: DataHandler, dataset_path: str, time_step: int, color_map: str,
+                 parent: Optional[QWidget] = None):
+        """Construct the worker.
+
+        Args:
+            data_handler: The data handler.
+            dataset_path: The path to the dataset.
+            time_step: The dataset time step.
+            color_map: Color map to use.
+            parent: The parent object.
+        """
+        super().__init__(parent)
+        self._data_handler = data_handler
+        self._dataset_path = dataset_path
+        self._time_step = time_step
+        self._color_map = color_map
+
+    def run(self):
+        """Build the plot."""
+        try:
+            figure = get_dataset_plot(self._data_handler, self._dataset_path, self._time_step, self._color_map)
+        except Exception as error:
+            self.plot_failed.emit(str(error))
+            return
+        self.plot_built.emit(figure)
 
 
 class DatasetPlotWindow(QMainWindow):
@@ -248,11 +535,49 @@ class DatasetPlotWindow(QMainWindow):
         self.main_widget = QWidget(self)
         self.setCentralWidget(self.main_widget)
 
-        layout = QVBoxLayout(self.main_widget)
-        canvas = PlotCanvas(data_handler, dataset_path, time_step, color_map)
-        layout.addWidget(canvas)
-        self.addToolBar(QtCore.Qt.BottomToolBarArea, NavigationToolbar(canvas, self))
+        self._layout = QVBoxLayout(self.main_widget)
+        self._status_label = QLabel('Loading plot...', self.main_widget)
+        self._status_label.setAlignment(Qt.AlignCenter)
+        self._layout.addWidget(self._status_label)
         self.main_widget.setFocus()
+        self._plot_thread = PlotCanvas.build_async(data_handler, dataset_path, time_step, color_map,
+                                                   self._on_canvas_built, self._on_plot_failed, self)
+
+    def _on_canvas_built(self, canvas: PlotCanvas):
+        """Show the plot once it has been built.
+
+        Args:
+            canvas: The plot's canvas.
+        """
+        self._layout.removeWidget(self._status_label)
+        self._status_label.deleteLater()
+        self._layout.addWidget(canvas)
+        self.addToolBar(QtCore.Qt.BottomToolBarArea, NavigationToolbar(canvas, self))
+        # The layout only picks up the canvas' size once it has been shown
+        if self.isVisible():
+            QTimer.singleShot(0, self.adjustSize)
+
+    def _on_plot_failed(self, message: str):
+        """Show why the plot couldn't be built.
+
+        Args:
+            message: The error message.
+        """
+        self._status_label.setText(f'Unable to plot the dataset: {message}')
+
+    def closeEvent(self, event):  # noqa: N802
+        """Close the window once its plot has finished building.
+
+        Args:
+            event: The close event.
+        """
+        if self._plot_thread.isRunning():
+            # Deleting the window would delete its running worker thread, so hide it and close once the thread is done
+            self.hide()
+            self._plot_thread.finished.connect(self.close)
+            event.ignore()
+            return
+        super().closeEvent(event)
 
 
 class DatasetPlotInfo(QDialog):
@@ -268,6 +593,7 @@ class DatasetPlotInfo(QDialog):
         """
         super().__init__(parent)
         self._data_handler = data_handler
+        self._time_step_counts = {}  # Dataset path -> number of time steps, so each dataset is only opened once
         self.last_dataset = None
 
         self.setWindowTitle("Plot Dataset")
@@ -288,11 +614,9 @@ class DatasetPlotInfo(QDialog):
         self.time_step_combo.currentTextChanged.connect(self._combo_changed)
 
         # UI for selecting a color map
-        color_maps: list[str] = pyplot.colormaps()
-        color_maps = sorted(color_maps, key=str.lower)
         self.color_map_combo = QComboBox()
         self.color_map_combo.setPlaceholderText("Select a color map")
-        self.color_map_combo.addItems(color_maps)
+        self.color_map_combo.addItems(_sorted_color_maps())
         self.color_map_combo.setCurrentText(color_map)
         self.color_map_combo.currentTextChanged.connect(self._combo_changed)
 
@@ -323,14 +647,16 @@ class DatasetPlotInfo(QDialog):
         current_dataset = self.dataset_combo.currentText()
         current_time_step = self.time_step_combo.currentText()
         if current_dataset != self.last_dataset:
-            dataset = self._data_handler.get_input_dataset(current_dataset)
-            if dataset is not None:
-                time_steps = [str(time_step + 1) for time_step in range(dataset.num_times)]
-            else:
-                time_steps = ["1"]
-            self.time_step_combo.addItems(time_steps)
-            if current_time_step in time_steps:
-                self.time_step_combo.setCurrentText(current_time_step)
+            if current_dataset not in self._time_step_counts:
+                dataset = self._data_handler.get_input_dataset(current_dataset)
+                self._time_step_counts[current_dataset] = dataset.num_times if dataset is not None else 1
+            time_steps = [str(time_step + 1) for time_step in range(self._time_step_counts[current_dataset])]
+            # Replace the previous dataset's time steps without coming back here for every change
+            with QSignalBlocker(self.time_step_combo):
+                self.time_step_combo.clear()
+                self.time_step_combo.addItems(time_steps)
+                if current_time_step in time_steps:
+                    self.time_step_combo.setCurrentText(current_time_step)
             self.last_dataset = current_dataset
         dataset_index = self.dataset_combo.currentIndex()
         time_step_index = self.time_step_combo.currentIndex()
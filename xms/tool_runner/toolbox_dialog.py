@@ -1,11 +1,13 @@
 """Toolbox dialog."""
+from collections import namedtuple
+from functools import lru_cache
 import os
-from pathlib import Path
 import sys
 from typing import Optional, Tuple
 
-from PySide6.QtCore import QItemSelection, QPoint, QSortFilterProxyModel, Qt
-from PySide6.QtGui import QIcon, QStandardItem, QStandardItemModel
+from PySide6.QtCore import (QAbstractItemModel, QItemSelection, QModelIndex, QObject, QPoint, QSortFilterProxyModel, Qt,
+                            QThread, QTimer)
+from PySide6.QtGui import QIcon, QStandardItem
 from PySide6.QtWidgets import (QAbstractItemDelegate, QAbstractItemView, QApplication, QDialog, QFileDialog,
                                QGridLayout, QHBoxLayout, QHeaderView, QLabel, QLineEdit, QMenu, QPushButton,
                                QSizePolicy, QSpacerItem, QTabWidget, QTreeView, QVBoxLayout, QWidget)
@@ -14,11 +16,20 @@ from xms.guipy.dialogs.message_box import message_with_ok
 from xms.tool_core import DataHandler
 
 from xms.tool_runner.plotting import DatasetPlotWindow, get_dataset_plot_info
-from xms.tool_runner.toolbox_history import string_matches_search, ToolboxHistory
+from xms.tool_runner.toolbox_history import load_history_file, ToolboxHistory
 from xms.tool_runner.toolbox_tools import ToolboxTools
 
 
-windows = []
+_SEARCH_DELAY_MS = 150  # Wait this long after the last keystroke before searching
+_HISTORY_WRITE_DELAY_MS = 250  # Wait this long after the last history change before writing the history file
+
+_UUID_ROLE = Qt.UserRole + 1
+_NAME_LOWER_ROLE = Qt.UserRole + 2
+_DESCRIPTION_LOWER_ROLE = Qt.UserRole + 3
+_CHARACTER_BITS_ROLE = Qt.UserRole + 4
+
+_AvailableTool = namedtuple('_AvailableTool', ['category', 'name', 'uuid', 'description', 'name_lower',
+                                               'description_lower', 'character_bits'])
 
 
 def resource_path(resource_file: str) -> str:
@@ -35,6 +46,20 @@ def resource_path(resource_file: str) -> str:
     return path
 
 
+@lru_cache(maxsize=None)
+def _get_icon(resource_file: str) -> QIcon:
+    """
+    Get an icon, loading it the first time it is used and sharing it after that.
+
+    Args:
+        resource_file: Relative path of the icon file in the toolbox icons folder.
+
+    Returns:
+        The icon.
+    """
+    return QIcon(resource_path(resource_file))
+
+
 class QTreeViewWithEditor(QTreeView):
     """Tree view widget with editor."""
 
@@ -67,6 +92,256 @@ class QTreeViewWithEditor(QTreeView):
         super().closeEditor(editor, hint)
 
 
+class ToolModel(QAbstractItemModel):
+    """
+    Model of the available tools, grouped by category.
+
+    The tools are kept in parallel lists rather than as a QStandardItem each. Category indexes have an internal ID of
+    0, and tool indexes have their category's row plus one.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Initializes the object.
+
+        Args:
+            parent: The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self._categories = []  # Category names
+        self._category_tools = []  # The tools in each category, as indexes into the tool lists
+        self._names = []
+        self._uuids = []
+        self._descriptions = []
+        self._name_lowers = []
+        self._description_lowers = []
+        self._character_bits = []  # The name's and description's _character_bits
+
+    def set_tools(self, tools: list[_AvailableTool]):
+        """
+        Replace the tools in the model.
+
+        Args:
+            tools: The tools.
+        """
+        self.beginResetModel()
+        self._categories = []
+        self._category_tools = []
+        self._names = []
+        self._uuids = []
+        self._descriptions = []
+        self._name_lowers = []
+        self._description_lowers = []
+        self._character_bits = []
+        category_buckets = {}  # key=category name, value=the category's tools
+        for tool in tools:
+            category_buckets.setdefault(tool.category, []).append(tool)
+        # Store each category's tools together, so a category's tools are a range of the tool lists
+        for category, category_tools in category_buckets.items():
+            first_tool = len(self._names)
+            self._categories.append(category)
+            self._category_tools.append(range(first_tool, first_tool + len(category_tools)))
+            self._names.extend(tool.name for tool in category_tools)
+            self._uuids.extend(tool.uuid for tool in category_tools)
+            self._descriptions.extend(tool.description for tool in category_tools)
+            self._name_lowers.extend(tool.name_lower for tool in category_tools)
+            self._description_lowers.extend(tool.description_lower for tool in category_tools)
+            self._character_bits.extend(tool.character_bits for tool in category_tools)
+        self.endResetModel()
+
+    def tool_uuid(self, index: QModelIndex) -> Optional[str]:
+        """
+        Get the UUID of a tool.
+
+        Args:
+            index: The tool's index.
+
+        Returns:
+            The tool's UUID, or None if the index isn't a tool.
+        """
+        if not index.isValid() or index.internalId() == 0:
+            return None
+        return self._uuids[self._category_tools[index.internalId() - 1][index.row()]]
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        """
+        Get the index of an item.
+
+        Args:
+            row: The item's row.
+            column: The item's column.
+            parent: The item's parent.
+
+        Returns:
+            The index.
+        """
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if parent.isValid():
+            return self.createIndex(row, column, parent.row() + 1)
+        return self.createIndex(row, column, 0)
+
+    def parent(self, index: Optional[QModelIndex] = None):
+        """
+        Get the parent of an item.
+
+        Args:
+            index: The item's index. If not given, this is QObject.parent().
+
+        Returns:
+            The category's index for a tool, or an invalid index for a category.
+        """
+        if index is None:
+            return QObject.parent(self)
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        """
+        Get the number of children of an item.
+
+        Args:
+            parent: The item's index.
+
+        Returns:
+            The number of categories for the root, the number of tools for a category, and 0 for a tool.
+        """
+        if not parent.isValid():
+            return len(self._categories)
+        if parent.internalId() == 0:
+            return len(self._category_tools[parent.row()])
+        return 0
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        """
+        Get the number of columns.
+
+        Args:
+            parent: The parent's index.
+
+        Returns:
+            The number of columns.
+        """
+        return 1
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """
+        Get the data for an item.
+
+        Args:
+            index: The item's index.
+            role: The role of the data.
+
+        Returns:
+            The data, or None if the item doesn't have data for the role.
+        """
+        if not index.isValid():
+            return None
+        category_id = index.internalId()
+        if category_id == 0:
+            if role == Qt.DisplayRole:
+                return self._categories[index.row()]
+            if role == Qt.DecorationRole:
+                return _get_icon("toolbox_category.svg")
+            return None
+        tool = self._category_tools[category_id - 1][index.row()]
+        if role == Qt.DisplayRole:
+            return self._names[tool]
+        if role == Qt.DecorationRole:
+            return _get_icon("toolbox_tool.svg")
+        if role == Qt.ToolTipRole:
+            return self._descriptions[tool]
+        if role == _UUID_ROLE:
+            return self._uuids[tool]
+        if role == _NAME_LOWER_ROLE:
+            return self._name_lowers[tool]
+        if role == _DESCRIPTION_LOWER_ROLE:
+            return self._description_lowers[tool]
+        if role == _CHARACTER_BITS_ROLE:
+            return self._character_bits[tool]
+        return None
+
+
+class ToolFilterProxy(QSortFilterProxyModel):
+    """Proxy model that shows the tools whose name or description contains all the search strings."""
+
+    def __init__(self, parent=None):
+        """
+        Initializes the object.
+
+        Args:
+            parent: The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self._search_strings_lower = []
+        self._search_bits = 0
+        self.setRecursiveFilteringEnabled(True)  # Show the categories of the matching tools
+
+    def set_search_strings(self, search_strings: list[str]):
+        """
+        Set the search strings and filter the tools again.
+
+        Args:
+            search_strings: The strings to match against the tool names and descriptions. Empty to show every tool.
+        """
+        self._search_strings_lower = [search_string.lower() for search_string in search_strings]
+        self._search_bits = _character_bits(''.join(self._search_strings_lower))
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:  # noqa: N802
+        """
+        Determine if a row should be shown.
+
+        Args:
+            source_row: The row in the source model.
+            source_parent: The parent of the row in the source model.
+
+        Returns:
+            True if the row should be shown.
+        """
+        if not self._search_strings_lower:
+            return True
+        if not source_parent.isValid():
+            return False  # A category. It is shown if one of its tools matches.
+        # The name and description were lower-cased when the tools were added, and the search strings when they were set
+        # Text missing any of the search strings' characters can't match, so skip the substring tests for it
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        name_bits, description_bits = index.data(_CHARACTER_BITS_ROLE)
+        if name_bits & self._search_bits == self._search_bits:
+            name_lower = index.data(_NAME_LOWER_ROLE)
+            if all(search_string in name_lower for search_string in self._search_strings_lower):
+                return True
+        if description_bits & self._search_bits == self._search_bits:
+            description_lower = index.data(_DESCRIPTION_LOWER_ROLE)
+            return all(search_string in description_lower for search_string in self._search_strings_lower)
+        return False
+
+
+class _ReadHistoryThread(QThread):
+    """Worker thread that reads a project's history file."""
+
+    def __init__(self, project_folder: str, parent=None):
+        """
+        Construct the worker.
+
+        Args:
+            project_folder: The path to the project folder.
+            parent: The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.project_folder = project_folder
+        self.history = []
+        self.error = ''
+
+    def run(self):
+        """Read the history file."""
+        try:
+            self.history = load_history_file(self.project_folder)
+        except (OSError, ValueError) as error:
+            self.error = str(error)
+
+
 class QDlgToolbox(QDialog):
     """Toolbox dialog with tool and history tabs."""
 
@@ -81,12 +356,11 @@ class QDlgToolbox(QDialog):
         self.data_handler = None
         self.new_history_selection = False
         self.color_map = 'magma'
+        self._plot_windows = set()  # Open plot windows, which have no parent to keep them alive
         self.setup_ui()
 
-        self.search_string_active = False
-        self.tool_model = QStandardItemModel(0, 1, self)
-        self.search_tool_model = QStandardItemModel(0, 1, self)
-        self.proxy_model_tool = QSortFilterProxyModel(self)
+        self.tool_model = ToolModel(self)
+        self.proxy_model_tool = ToolFilterProxy(self)
         self.proxy_model_tool.setSortCaseSensitivity(Qt.CaseInsensitive)
         self.proxy_model_tool.setSourceModel(self.tool_model)
         self.tool_tree_view.setModel(self.proxy_model_tool)
@@ -109,7 +383,7 @@ class QDlgToolbox(QDialog):
         self.tool_tree_view.doubleClicked.connect(self.run_tool_from_tools)
         self.tool_tree_view.selectionModel().selectionChanged.connect(self.tool_selection_changed)
         self.button_run.clicked.connect(self.on_tool_button_run)
-        self.edt_search.textChanged.connect(self.search_toolbox_strings)
+        self.edt_search.textChanged.connect(self._on_tool_search_changed)
         self.history_tree_view.customContextMenuRequested.connect(self.history_right_click_menu)
         self.history_tree_view.doubleClicked.connect(self.run_tool_from_history)
         self.history_tree_view.selectionModel().selectionChanged.connect(self.history_selection_changed)
@@ -117,7 +391,7 @@ class QDlgToolbox(QDialog):
         self.button_run_history.clicked.connect(self.on_tool_button_run_from_history)
         self.button_delete_history.clicked.connect(self.on_tool_button_delete_from_history)
         self.button_notes.clicked.connect(self.on_tool_button_notes)
-        self.edt_search_history.textChanged.connect(self.search_history_strings)
+        self.edt_search_history.textChanged.connect(self._on_history_search_changed)
         self.project_button.clicked.connect(self.on_project_button_clicked)
         self.plot_button.clicked.connect(self.on_plot_button_clicked)
         self.add_tools()
@@ -207,27 +481,41 @@ class QDlgToolbox(QDialog):
         self.h_layout_btn.addItem(self.h_spcr_btn)
         self.vertical_layout.addLayout(self.h_layout_btn)
 
+        # Search once typing pauses rather than on every keystroke
+        self._tool_search_timer = QTimer(self)
+        self._tool_search_timer.setSingleShot(True)
+        self._tool_search_timer.setInterval(_SEARCH_DELAY_MS)
+        self._tool_search_timer.timeout.connect(self._on_tool_search_timeout)
+        self._history_search_timer = QTimer(self)
+        self._history_search_timer.setSingleShot(True)
+        self._history_search_timer.setInterval(_SEARCH_DELAY_MS)
+        self._history_search_timer.timeout.connect(self._on_history_search_timeout)
+
+        self._history_thread = None  # Reads the history file when the project folder changes
+
+        # Write the history file once changes stop coming rather than after each one
+        self._history_write_folder = ''
+        self._history_write_timer = QTimer(self)
+        self._history_write_timer.setSingleShot(True)
+        self._history_write_timer.setInterval(_HISTORY_WRITE_DELAY_MS)
+        self._history_write_timer.timeout.connect(self._write_pending_history)
+
     def add_tools(self):
         """Add the tools to the tool tree."""
-        tools = ToolboxTools.get_tool_list()
-        category_items = {}  # key=category name, value=model index
-        for tool in tools:
-            tool_program = tool['program_name']
-            if tool_available(tool_program):
-                category = tool['category']
-                name = tool['name']
-                tool_id = tool['uuid']
-                description = tool['description']
-                category_item = get_category_model_item(category, self.tool_model, category_items)
-                tool_text = name
-                tool_item = QStandardItem(tool_text)
-                tool_item.setEditable(False)
-                tool_item.setData(tool_id)
-                tool_item.setIcon(QIcon(resource_path("toolbox_tool.svg")))
-                tool_item.setToolTip(description)
-                category_item.appendRow(tool_item)
+        self.tool_model.set_tools(_available_tools())
         self.tool_tree_view.sortByColumn(0, Qt.AscendingOrder)
 
+    def done(self, result: int):
+        """
+        Write any pending history changes before the dialog closes.
+
+        Args:
+            result: The dialog result.
+        """
+        self._finish_history_read()
+        self._write_pending_history()
+        super().done(result)
+
     @property
     def project_folder(self) -> str:
         """
@@ -238,39 +526,6 @@ class QDlgToolbox(QDialog):
         """
         return self.project_folder_label.text()
 
-    def set_tool_search_strings(self, search_strings: list[str]):
-        """
-        Set the tool search strings.
-
-        Args:
-            search_strings: The list of search strings to match against the tool names and descriptions.
-        """
-        tools = ToolboxTools.get_tool_list()
-
-        search_strings_lower = [search_string.lower() for search_string in search_strings]
-        self.search_tool_model.clear()
-        self.search_tool_model.setColumnCount(1)
-        category_items = {}  # key=category name, value=model index
-        for tool in tools:
-            tool_program = tool['program_name']
-            if tool_available(tool_program):
-                category = tool['category']
-                name = tool['name']
-                tool_id = tool['uuid']
-                description = tool['description']
-                category_item = get_category_model_item(category, self.search_tool_model, category_items)
-                matches_description = string_matches_search(description, search_strings_lower)
-                matches_name = string_matches_search(name, search_strings_lower)
-                if matches_description or matches_name:
-                    tool_text = name
-                    tool_item = QStandardItem(tool_text)
-                    tool_item.setEditable(False)
-                    tool_item.setData(tool_id)
-                    tool_item.setIcon(QIcon(resource_path("tool_item.png")))
-                    tool_item.setToolTip(description)
-                    category_item.appendRow(tool_item)
-        self.tool_tree_view.sortByColumn(0, Qt.AscendingOrder)
-
     def get_tool_uuid(self, index: int) -> Tuple[bool, Optional[str]]:
         """
         Get the tool uuid for a given index.
@@ -281,18 +536,8 @@ class QDlgToolbox(QDialog):
         Returns:
             (found, tool_uuid): If the tool was found, and the tool uuid or None.
         """
-        item_idx = self.proxy_model_tool.mapToSource(index)
-        if self.search_string_active:
-            tool_item = self.search_tool_model.itemFromIndex(item_idx)
-        else:
-            tool_item = self.tool_model.itemFromIndex(item_idx)
-        item_data = tool_item.data()
-        tool_uuid = None
-        found = False
-        if isinstance(item_data, str):
-            tool_uuid = item_data
-            found = True
-        return found, tool_uuid
+        tool_uuid = self.tool_model.tool_uuid(self.proxy_model_tool.mapToSource(index))
+        return tool_uuid is not None, tool_uuid
 
     def get_history_uuid(self, index: int) -> str:
         """Get the UUID for a history item at a given index.
@@ -303,12 +548,25 @@ class QDlgToolbox(QDialog):
         Returns:
             The UUID data of the history item, or an empty string if the item does not exist.
         """
-        history_item = self.history_model.itemFromIndex(index)
+        history_item = self._get_history_item(index)
         uuid = ""
         if history_item:
             uuid = history_item.data()
         return uuid
 
+    def _get_history_item(self, index: QModelIndex) -> Optional[QStandardItem]:
+        """Get the history model item shown at an index of the history view.
+
+        Args:
+            index: The index in the history view's model, which is the search proxy while searching.
+
+        Returns:
+            The item, or None if the index isn't valid.
+        """
+        if index.model() is self.toolbox_history.history_search_model:
+            index = self.toolbox_history.history_search_model.mapToSource(index)
+        return self.history_model.itemFromIndex(index)
+
     def tool_right_click_menu(self, point: QPoint):
         """
         Create and handle menu for right click in tool view.
@@ -341,7 +599,7 @@ class QDlgToolbox(QDialog):
             menu.addAction("Run Tool From History...", self.on_tool_button_run_from_history)
             menu.addAction("Delete From History...", self.on_tool_button_delete_from_history)
             menu.addAction("Notes...", self.on_tool_button_notes)
-            history_item = self.history_model.itemFromIndex(index)
+            history_item = self._get_history_item(index)
             if history_item:
                 if history_item.isEditable():
                     menu.addAction("Edit", self.on_edit_history_item)
@@ -395,11 +653,39 @@ class QDlgToolbox(QDialog):
     def on_project_button_clicked(self):
         """Handle click on the select project folder button."""
         project_folder = QFileDialog.getExistingDirectory()
+        # Write the old project's history, including any tools run while it was being read, before showing another
+        self._finish_history_read()
+        self._write_pending_history()
         self.project_folder_label.setText(project_folder)
-        self.toolbox_history.read_history_file(project_folder)
+        self.toolbox_history.clear()
         self.search_history_strings(self.edt_search_history.text())
+        self.history_tree_view.setEnabled(False)
+        self._history_thread = _ReadHistoryThread(project_folder, self)
+        self._history_thread.finished.connect(self._on_history_read)
+        self._history_thread.start()
         self.on_new_project_folder()
 
+    def _finish_history_read(self):
+        """Wait for the history file being read, if any, and show it."""
+        if self._history_thread is not None:
+            self._history_thread.finished.disconnect(self._on_history_read)
+            self._history_thread.wait()
+            self._on_history_read()
+
+    def _on_history_read(self):
+        """Show the history once the worker thread has read it."""
+        thread = self._history_thread
+        self._history_thread = None
+        self.history_tree_view.setEnabled(True)
+        # Keep any tools that were run while the file was being read
+        self.toolbox_history.set_history(thread.history + self.toolbox_history.history)
+        self.search_history_strings(self.edt_search_history.text())
+        thread.deleteLater()
+        if thread.error:
+            message_with_ok(self, f"Unable to read the history file: {thread.error}", "SMS")
+        if self._history_write_folder:
+            self._history_write_timer.start()
+
     def on_plot_button_clicked(self):
         """Handle click on the plot dataset button."""
         data_handler = DataHandler(file_folder=self.project_folder)
@@ -408,8 +694,10 @@ class QDlgToolbox(QDialog):
             time_step = plot_info.time_step
             self.color_map = plot_info.color_map
             window = DatasetPlotWindow(data_handler, plot_info.dataset, time_step, self.color_map)
+            window.setAttribute(Qt.WA_DeleteOnClose)
+            self._plot_windows.add(window)
+            window.destroyed.connect(lambda: self._plot_windows.discard(window))
             window.show()
-            windows.append(window)
 
     def on_new_project_folder(self):
         """Handle change to new project folder."""
@@ -447,7 +735,7 @@ class QDlgToolbox(QDialog):
                 results = ToolboxTools.run_tool(run_input, project_folder)
                 if results is not None:
                     self.toolbox_history.add_item(results)
-                    self.toolbox_history.write_history_file(project_folder)
+                    self._schedule_history_write(project_folder)
                     self.search_history_strings(self.edt_search_history.text())
         else:
             message_with_ok(self, "Please select the project folder.", "SMS")
@@ -476,7 +764,7 @@ class QDlgToolbox(QDialog):
         """Handle editing a tool history item."""
         selected = self.history_tree_view.selectionModel().selectedIndexes()
         if selected:
-            history_item = self.history_model.itemFromIndex(selected[0])
+            history_item = self._get_history_item(selected[0])
             if history_item:
                 if history_item.isEditable():
                     self.history_tree_view.edit(selected[0])
@@ -494,6 +782,44 @@ class QDlgToolbox(QDialog):
             # pr_properties_and_notes_dialog("Notes for " + description, props, None, XmUuid(uuid),
             #                                "SearchKey_Toolbox_History_Notes")
 
+    def _schedule_history_write(self, project_folder: str):
+        """
+        Write the history file after a short delay, so several changes in a row only write it once.
+
+        Changing the project folder writes any pending changes first, so they are always for the shown project.
+
+        Args:
+            project_folder: The project folder to write the history file in.
+        """
+        self._history_write_folder = project_folder
+        self._history_write_timer.start()
+
+    def _write_pending_history(self):
+        """Write the history file now if there are changes that haven't been written."""
+        self._history_write_timer.stop()
+        if self._history_thread is not None:
+            return  # Written once the history file has been read, so the changes aren't lost
+        if self._history_write_folder:
+            project_folder = self._history_write_folder
+            self._history_write_folder = ''
+            self.toolbox_history.write_history_file(project_folder)
+
+    def _on_tool_search_changed(self):
+        """Restart the wait before searching the tools."""
+        self._tool_search_timer.start()
+
+    def _on_history_search_changed(self):
+        """Restart the wait before searching the history."""
+        self._history_search_timer.start()
+
+    def _on_tool_search_timeout(self):
+        """Search the tools for the text typed in the search box."""
+        self.search_toolbox_strings(self.edt_search.text())
+
+    def _on_history_search_timeout(self):
+        """Search the history for the text typed in the search box."""
+        self.search_history_strings(self.edt_search_history.text())
+
     def search_toolbox_strings(self, search_strings):
         """
         Filters the tools based on the provided search strings.
@@ -502,27 +828,12 @@ class QDlgToolbox(QDialog):
             search_strings: Search strings used to filter the tools.
         """
         filter_strings = search_strings.strip()
-        if not filter_strings:
-            # filter strings empty so show everything
-            self.search_string_active = False
-            self.proxy_model_tool = QSortFilterProxyModel(self)
-            self.proxy_model_tool.setSortCaseSensitivity(Qt.CaseInsensitive)
-            self.proxy_model_tool.setSourceModel(self.tool_model)
-            self.tool_tree_view.setModel(self.proxy_model_tool)
-            self.tool_tree_view.setHeaderHidden(True)
-            self.tool_tree_view.selectionModel().selectionChanged.connect(self.tool_selection_changed)
-            return
-
-        # filter tree view to items containing strings
-        self.search_string_active = True
-        self.set_tool_search_strings(get_search_strings(filter_strings))
-        self.proxy_model_tool = QSortFilterProxyModel(self)
-        self.proxy_model_tool.setSortCaseSensitivity(Qt.CaseInsensitive)
-        self.proxy_model_tool.setSourceModel(self.search_tool_model)
-        self.tool_tree_view.setModel(self.proxy_model_tool)
-        self.tool_tree_view.setHeaderHidden(True)
-        self.tool_tree_view.expandAll()
-        self.tool_tree_view.selectionModel().selectionChanged.connect(self.tool_selection_changed)
+        self.proxy_model_tool.set_search_strings(get_search_strings(filter_strings))
+        if filter_strings:
+            # Only the categories have children, and the proxy only keeps the ones with a matching tool
+            self.tool_tree_view.expandToDepth(0)
+        else:
+            self.tool_tree_view.collapseAll()
 
     def search_history_strings(self, search_strings: str):
         """
@@ -534,19 +845,32 @@ class QDlgToolbox(QDialog):
         filter_strings = search_strings.strip()
         if not filter_strings:
             # filter strings empty so show everything
-            self.history_model = self.toolbox_history.get_model()
-            self.history_tree_view.setModel(self.history_model)
-            self.history_tree_view.setHeaderHidden(True)
+            self._set_history_view_model(self.history_model)
+            self.toolbox_history.set_search_strings([])
+            self.enable_history_buttons()
             return
 
         # filter tree view to items containing strings
         self.toolbox_history.set_search_strings(get_search_strings(filter_strings))
-        self.history_model = self.toolbox_history.history_search_model
-        self.history_tree_view.setModel(self.history_model)
-        self.history_tree_view.setHeaderHidden(True)
+        self._set_history_view_model(self.toolbox_history.history_search_model)
         self.history_tree_view.expandAll()
         self.enable_history_buttons()
 
+    def _set_history_view_model(self, model: QAbstractItemModel):
+        """
+        Show a model in the history view, if it isn't already showing it.
+
+        Args:
+            model: The history model or the search proxy.
+        """
+        if self.history_tree_view.model() is model:
+            return
+        old_selection_model = self.history_tree_view.selectionModel()
+        self.history_tree_view.setModel(model)
+        # The view makes a new selection model for the new model
+        old_selection_model.deleteLater()
+        self.history_tree_view.selectionModel().selectionChanged.connect(self.history_selection_changed)
+
     def delete_history_item(self, index):
         """
         Delete a tool run from the toolbox history.
@@ -557,7 +881,7 @@ class QDlgToolbox(QDialog):
         uuid = self.get_history_uuid(index)
         if uuid:
             self.toolbox_history.delete_item(uuid)
-            self.toolbox_history.write_history_file(self.project_folder)
+            self._schedule_history_write(self.project_folder)
             self.search_history_strings(self.edt_search_history.text())
 
     def run_tool_from_history(self, index):
@@ -578,42 +902,59 @@ class QDlgToolbox(QDialog):
             results = ToolboxTools.run_tool(run_info, project_folder)
             if results is not None:
                 self.toolbox_history.add_item(results)
-                self.toolbox_history.write_history_file(project_folder)
+                self._schedule_history_write(project_folder)
                 self.search_history_strings(self.edt_search_history.text())
 
 
-def tool_available(tool_program: str) -> bool:
-    """Determine if tool is available.
+@lru_cache(maxsize=1)
+def _available_tools() -> list[_AvailableTool]:
+    """Get the tools that are available in the current program.
+
+    The tools are registered when XMS starts, so this only needs to be done once.
 
     Returns:
-        True if the tool is available.
+        The available tools.
     """
-    tool_program = tool_program.lower()
-    current_program = _get_three_letter_xms_program_name().lower()
-    return tool_program in ["", "xms", current_program]
-
+    tools = []
+    for tool in ToolboxTools.get_tool_list():
+        if tool_available(tool['program_name']):
+            name = tool['name']
+            description = tool['description']
+            name_lower = name.lower()
+            description_lower = description.lower()
+            character_bits = (_character_bits(name_lower), _character_bits(description_lower))
+            tools.append(_AvailableTool(tool['category'], name, tool['uuid'], description, name_lower,
+                                        description_lower, character_bits))
+    return tools
+
+
+def _character_bits(text: str) -> int:
+    """
+    Get a bit mask of the characters in a string, for quickly ruling out strings that can't contain a search string.
 
-def get_category_model_item(category_name, model, category_items) -> QStandardItem:
-    """Get the category model item.
+    Characters share bits, so a string whose mask covers a search string's mask may still not contain it.
 
     Args:
-        category_name: The name of the category.
-        model: The model used for displaying items in the tool program.
-        category_items: The dictionary containing existing category items.
+        text: The string.
+
+    Returns:
+        The mask, with bit ord(char) % 64 set for each character.
+    """
+    bits = 0
+    for char in set(text):
+        bits |= 1 << (ord(char) & 63)
+    return bits
+
+
+def tool_available(tool_program: str) -> bool:
+    """Determine if tool is available.
 
     Returns:
-        The category item from the category_items dictionary.
+        True if the tool is available.
     """
-    if category_name not in category_items:
-        # new category so add it
-        category_item = QStandardItem(category_name)
-        category_item.setEditable(False)
-        category_item.setIcon(QIcon(resource_path("toolbox_category.svg")))
-        model.appendRow(category_item)
-        category_items[category_name] = category_item
-    else:
-        category_item = category_items[category_name]
-    return category_item
+    tool_program = tool_program.lower()
+    current_program = _get_three_letter_xms_program_name().lower()
+    return tool_program in ["", "xms", current_program]
 
 
 def get_search_strings(filter_string: str) -> list[str]:
@@ -646,11 +987,11 @@ def _valid_project_folder(project_folder: str) -> bool:
     Returns:
         True if the project folder is valid, False otherwise.
     """
-    valid = not any(Path(project_folder).iterdir())  # folder is empty
-    if not valid:
-        one_required = ['grids', 'coverages', 'rasters']
-        valid = any(os.path.exists(os.path.join(project_folder, folder)) for folder in one_required)
-    return valid
+    one_required = ['grids', 'coverages', 'rasters']
+    if any(os.path.exists(os.path.join(project_folder, folder)) for folder in one_required):
+        return True
+    with os.scandir(project_folder) as entries:
+        return next(entries, None) is None  # folder is empty
 
 
 def show_toolbox():
@@ -660,7 +1001,6 @@ def show_toolbox():
     toolbox = QDlgToolbox()
     toolbox.setModal(False)
     toolbox.show()
-    windows.append(toolbox)
     sys.exit(app.exec())
 
 
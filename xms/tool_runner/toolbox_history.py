@@ -1,10 +1,18 @@
 """Manage toolbox history."""
+from functools import lru_cache
 import json
 import os
-from typing import Any, List, Optional, Tuple
+import re
+from typing import Any, List, Optional, Tuple, Union
 
+import orjson
+from PySide6.QtCore import QModelIndex, QSortFilterProxyModel, Qt
 from PySide6.QtGui import QIcon, QStandardItem, QStandardItemModel
 
+_ICON_FOLDER = os.path.join(os.path.dirname(__file__), 'toolbox_icons')
+_SEARCH_TEXT_ROLE = Qt.UserRole + 2  # Lower-cased text of the items searches can match
+_OUTPUT_MARKERS = re.compile(r'^(?:\$XMS_BOLD\$)?(?:\$XMS_LEVEL\$)?', re.MULTILINE)  # Formatting at line starts
+
 
 def resource_path(relative_path: str) -> str:
     """
@@ -16,9 +24,72 @@ def resource_path(relative_path: str) -> str:
     Returns:
         The full path of the resource file.
     """
-    # get path of python file
-    path = os.path.join(os.path.dirname(__file__), 'toolbox_icons', relative_path)
-    return path
+    return os.path.join(_ICON_FOLDER, relative_path)
+
+
+_DATE_ICON = resource_path("tool_date_history_item.svg")
+_SUCCESS_ICON = resource_path("tool_history_item_success.svg")
+_FAILURE_ICON = resource_path("tool_history_item_failure.svg")
+_OUTPUT_ICON = resource_path("tool_history_output_item.svg")
+_ARGUMENT_ICON = resource_path("tool_history_arg_item.png")
+
+
+@lru_cache(maxsize=None)
+def _get_icon(icon: str) -> QIcon:
+    """
+    Get an icon, loading it the first time it is used and sharing it after that.
+
+    Args:
+        icon: The path of the icon file.
+
+    Returns:
+        The icon.
+    """
+    return QIcon(icon)
+
+
+class HistoryFilterProxy(QSortFilterProxyModel):
+    """Filter proxy showing the history items matching a search."""
+
+    def __init__(self, parent=None):
+        """
+        Initializes the proxy.
+
+        Args:
+            parent: The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self._search_strings_lower = []
+        self._min_length = 0  # Text shorter than the longest search string can't match
+        # Dates and the Input/Output headings show when any of the lines under them match
+        self.setRecursiveFilteringEnabled(True)
+
+    def set_search_strings(self, search_strings_lower: List[str]) -> None:
+        """
+        Filter the history for the given search strings.
+
+        Args:
+            search_strings_lower: The list of lower-cased search strings.
+        """
+        self._search_strings_lower = search_strings_lower
+        self._min_length = max((len(search_string) for search_string in search_strings_lower), default=0)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:  # noqa: N802
+        """
+        Determine if a row matches the search.
+
+        Args:
+            source_row: The row in the source model.
+            source_parent: The parent of the row in the source model.
+
+        Returns:
+            True if the row's notes, argument or output line contains all the search strings.
+        """
+        search_text = self.sourceModel().index(source_row, 0, source_parent).data(_SEARCH_TEXT_ROLE)
+        if search_text is None or len(search_text) < self._min_length:
+            return False
+        return _lower_string_matches_search(search_text, self._search_strings_lower)
 
 
 class ToolboxHistory:
@@ -27,15 +98,20 @@ class ToolboxHistory:
     def __init__(self):
         """Initializes a new instance of the class."""
         self.history = []
+        self._uuid_to_index = {}  # History UUID -> index of the item in self.history
         self.model = QStandardItemModel(0, 1)
-        self.history_search_model = QStandardItemModel(0, 1)
+        self._date_items = {}  # Date -> its item in self.model
+        self._notes_items = {}  # History UUID -> its notes item in self.model
+        self.history_search_model = HistoryFilterProxy()  # Only follows self.model while searching
         self.search_strings_lower = None
 
     def clear(self) -> None:
         """Clears the history."""
         self.history = []
+        self._uuid_to_index = {}
         self.model.clear()
-        self.history_search_model.clear()
+        self._date_items = {}
+        self._notes_items = {}
 
     def get_item_description(self, index: int) -> str:
         """
@@ -77,12 +153,26 @@ class ToolboxHistory:
             If the history does not contain the 'notes' key, it will be added with the description obtained from
             'get_item_description' method using the index of the added item in the history list.
         """
+        return self._add_item(history, self.model)
+
+    def _add_item(self, history: dict[str, Any], root: Union[QStandardItemModel, QStandardItem]) -> int:
+        """
+        Add an item to the history list and return the index of the added item.
+
+        Args:
+            history: The JSON object representing the item to be added to the history.
+            root: Where to add the item's date item, if the date doesn't have one yet.
+
+        Returns:
+            int: The index of the added item.
+        """
         history_index = len(self.history)
         self.history.append(history)
+        self._uuid_to_index[history["history_uuid"]] = history_index
         new_item = self.history[-1]
         if "notes" not in new_item:
             new_item["notes"] = self.get_item_description(len(self.history) - 1)
-        self._add_to_model(history_index)
+        self._add_to_model(history_index, root)
         return history_index
 
     def delete_item(self, history_uuid: str):
@@ -94,17 +184,17 @@ class ToolboxHistory:
         """
         index = self.get_history_index_from_uuid(history_uuid)
         if index is not None:
-            for row in range(self.model.rowCount()):
-                date_item = self.model.item(row)
-                if date_item:
-                    for description_row in range(date_item.rowCount()):
-                        compare_item = date_item.child(description_row)
-                        if compare_item is not None and compare_item.data == history_uuid:
-                            del date_item[description_row]
-                            break
-                    if date_item.rowCount() == 0:
-                        self.model.removeRow(row)
+            notes_item = self._notes_items.pop(history_uuid)
+            date_item = notes_item.parent()
+            date_item.removeRow(notes_item.row())
+            if date_item.rowCount() == 0:
+                del self._date_items[date_item.text()]
+                self.model.removeRow(date_item.row())
             del self.history[index]
+            del self._uuid_to_index[history_uuid]
+            # The items after the deleted one have moved up
+            for item in self.history[index:]:
+                self._uuid_to_index[item["history_uuid"]] -= 1
 
     def _get_item_data(self, index: int):
         """
@@ -134,17 +224,19 @@ class ToolboxHistory:
 
         return date, description, history_uuid, notes, arguments, output, run_status
 
-    def _add_to_model(self, history_index: int) -> None:
+    def _add_to_model(self, history_index: int, root: Union[QStandardItemModel, QStandardItem]) -> None:
         """
         Add the history for a given index to the model.
 
         Args:
             history_index:
                 The index of the history item to be added to the model.
+            root: Where to add the item's date item, if the date doesn't have one yet.
         """
         date, description, uuid, notes, arguments, output, run_status = self._get_item_data(history_index)
-        date_item = _get_date_item(self.model, date)
-        history_item = _add_notes(notes, uuid, run_status, date_item)
+        # Fill in the history item before adding it, so the model only reports one new row
+        history_item = _add_notes(notes, uuid, run_status, None)
+        self._notes_items[uuid] = history_item
 
         input_item = _create_input_items(arguments, uuid)
         history_item.appendRow(input_item)
@@ -153,54 +245,28 @@ class ToolboxHistory:
             output_item = _create_output_items(output, description, uuid)
             history_item.appendRow(output_item)
 
+        date_item = _get_date_item(root, self._date_items, date)
+        date_item.appendRow(history_item)
+
     def set_search_strings(self, search_strings: List[str]) -> None:
         """
         Update the search model for the given search strings.
 
+        Without any search strings, the search model is detached from the history model and left empty.
+
         Args:
             search_strings: A list of strings containing the search keywords.
         """
-        self.search_strings_lower = [search_string.lower() for search_string in search_strings]
-        self._update_search_model()
-
-    def _update_search_model(self) -> None:
-        """
-        Updates the search model for the history view.
-
-        This method clears the search model for the history view and populates it with filtered data based on the search
-        strings.
-        """
-        self.history_search_model.clear()
-        num_history = len(self.history)
-        for i in range(num_history):
-            date, description, uuid, notes, arguments, output, run_status = self._get_item_data(i)
-            input_item = None
-            output_item = None
-
-            for argument in arguments:
-                if string_matches_search(argument, self.search_strings_lower):
-                    if not input_item:
-                        input_item = _add_line_item("Input:", uuid, resource_path("tool_history_output_item.svg"))
-                    _add_line_item(argument, uuid, resource_path("tool_history_arg_item.png"), input_item)
-
-            if output:
-                if string_matches_search(description, self.search_strings_lower):
-                    if not output_item:
-                        output_item = _add_line_item("Output:", uuid, resource_path("tool_history_output_item.svg"))
-                    _add_line_item(description, uuid, "", output_item)
-                for line in output:
-                    if string_matches_search(line, self.search_strings_lower):
-                        if not output_item:
-                            output_item = _add_line_item("Output:", uuid, resource_path("tool_history_output_item.svg"))
-                        _add_line_item(line, uuid, "", output_item)
-
-            if string_matches_search(notes, self.search_strings_lower) or input_item or output_item:
-                date_item = _get_date_item(self.history_search_model, date)
-                history_item = _add_notes(notes, uuid, run_status, date_item)
-                if input_item:
-                    history_item.appendRow(input_item)
-                if output_item:
-                    history_item.appendRow(output_item)
+        # Longer search strings match fewer lines, so trying them first rules lines out sooner
+        self.search_strings_lower = sorted((search_string.lower() for search_string in search_strings if search_string),
+                                           key=len, reverse=True)
+        if not any(self.search_strings_lower):
+            # Nothing to filter, so keep the proxy from following changes to the history
+            self.history_search_model.setSourceModel(None)
+            return
+        self.history_search_model.set_search_strings(self.search_strings_lower)
+        if self.history_search_model.sourceModel() is None:
+            self.history_search_model.setSourceModel(self.model)
 
     def get_history_index_from_uuid(self, history_uuid: str) -> Optional[int]:
         """
@@ -212,10 +278,7 @@ class ToolboxHistory:
         Returns:
             The index of the history item if found, or None if no item with the specified UUID exists.
         """
-        for count, item in enumerate(self.history):
-            if item['history_uuid'] == history_uuid:
-                return count
-        return None
+        return self._uuid_to_index.get(history_uuid)
 
     def get_run_input(self, history_uuid: str) -> Optional[dict]:
         """
@@ -240,13 +303,23 @@ class ToolboxHistory:
         Args:
             project_folder: The path to the project folder.
         """
+        self.set_history(load_history_file(project_folder))
+
+    def set_history(self, history: list[dict[str, Any]]) -> None:
+        """
+        Replace the history with the given items.
+
+        Args:
+            history: The history items, as read by load_history_file.
+        """
         self.clear()
-        history_file = os.path.join(project_folder, "history.json")
-        if os.path.exists(history_file):
-            with open(history_file, 'r') as file:
-                new_history = json.load(file)
-                for item in new_history:
-                    self.add_item(item)
+        # Build the date items under a detached root, then add them to the model all at once
+        root = QStandardItem()
+        for item in history:
+            self._add_item(item, root)
+        date_items = [root.takeRow(row)[0] for row in reversed(range(root.rowCount()))]
+        date_items.reverse()
+        self.model.invisibleRootItem().appendRows(date_items)
 
     def write_history_file(self, project_folder: str) -> None:
         """
@@ -256,8 +329,35 @@ class ToolboxHistory:
             project_folder: The path to the project folder.
         """
         history_file = os.path.join(project_folder, "history.json")
-        with open(history_file, 'w') as file:
+        # Write a temporary file and swap it in, so a failed write can't leave a truncated history behind
+        temp_file = history_file + ".tmp"
+        # The json module keeps the file's format: 4 space indents, and NaN and Infinity, which orjson writes as null
+        with open(temp_file, 'w') as file:
             json.dump(self.history, file, indent=4)
+        os.replace(temp_file, history_file)
+
+
+def load_history_file(project_folder: str) -> list[dict[str, Any]]:
+    """
+    Read the history items from a project's JSON file.
+
+    This doesn't touch any Qt objects, so it can be called from a worker thread.
+
+    Args:
+        project_folder: The path to the project folder.
+
+    Returns:
+        The history items, or an empty list if the project doesn't have a history file.
+    """
+    history_file = os.path.join(project_folder, "history.json")
+    if not os.path.exists(history_file):
+        return []
+    with open(history_file, 'rb') as file:
+        data = file.read()
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)  # orjson doesn't read NaN or Infinity
 
 
 def _add_line_item(text: str,
@@ -282,39 +382,54 @@ def _add_line_item(text: str,
     line_item.setData(data)
     line_item.setEditable(editable)
     if icon:
-        line_item.setIcon(QIcon(icon))
+        line_item.setIcon(_get_icon(icon))
     if a_parent:
         a_parent.appendRow(line_item)
     return line_item
 
 
-def _get_date_item(model: QStandardItemModel, date: str) -> QStandardItem:
+def _add_search_line_item(text: str, data: Any, icon: str, a_parent: QStandardItem) -> QStandardItem:
+    """
+    Add a model line item that searches can match.
+
+    Args:
+        text: The text to be displayed for the line item.
+        data: The data to be associated with the line item.
+        icon: The icon to be displayed next to the line item, or an empty string for none.
+        a_parent: The parent item under which the line item should be added.
+
+    Returns:
+        The created QStandardItem object representing the line item.
+    """
+    line_item = _add_line_item(text, data, icon)
+    line_item.setData(text.lower(), _SEARCH_TEXT_ROLE)
+    a_parent.appendRow(line_item)
+    return line_item
+
+
+def _get_date_item(model: Union[QStandardItemModel, QStandardItem], date_items: dict[str, QStandardItem],
+                   date: str) -> QStandardItem:
     """
     Retrieve or create a date item from the model.
 
     Args:
-        model: The QStandardItemModel object representing the model where the date item will be searched and added.
+        model: The model, or item standing in for the model's root, where a new date item will be added.
+        date_items: The model's date items by date. New date items are added to it.
         date: The string representing the date item that needs to be retrieved or created.
 
     Returns:
         QStandardItem: The QStandardItem object representing the retrieved or created date item.
     """
-    date_item = None
-    # search for existing date item
-    for row in range(model.rowCount()):
-        compare_to_item = model.item(row, 0)
-        if compare_to_item and compare_to_item.text() == date:
-            # found existing date item
-            date_item = compare_to_item
-            break
-
-    if not date_item:
-        date_item = _add_line_item(date, "", resource_path("tool_date_history_item.svg"))
+    date_item = date_items.get(date)
+    if date_item is None:
+        date_item = _add_line_item(date, "", _DATE_ICON)
         model.appendRow(date_item)
+        date_items[date] = date_item
     return date_item
 
 
-def _add_notes(notes: str, history_uuid: str, ran_successfully: bool, parent: QStandardItem) -> QStandardItem:
+def _add_notes(notes: str, history_uuid: str, ran_successfully: bool,
+               parent: Optional[QStandardItem]) -> QStandardItem:
     """
     Add notest to a history item.
 
@@ -322,15 +437,17 @@ def _add_notes(notes: str, history_uuid: str, ran_successfully: bool, parent: QS
         notes: The notes to be added to the history item.
         history_uuid: The unique identifier for the history item.
         ran_successfully: Use success icon or failure icon.
-        parent: The parent item of the history item.
+        parent: The parent item of the history item, or None to leave the item without a parent.
 
     Returns:
         The new notes item.
     """
-    item_icon = resource_path("tool_history_item_success.svg")
-    if not ran_successfully:
-        item_icon = resource_path("tool_history_item_failure.svg")
-    return _add_line_item(notes, history_uuid, item_icon, parent, True)
+    item_icon = _SUCCESS_ICON if ran_successfully else _FAILURE_ICON
+    notes_item = _add_line_item(notes, history_uuid, item_icon, None, True)
+    notes_item.setData(notes.lower(), _SEARCH_TEXT_ROLE)
+    if parent:
+        parent.appendRow(notes_item)
+    return notes_item
 
 
 def _extract_arguments(history_json: dict) -> list[str]:
@@ -343,16 +460,7 @@ def _extract_arguments(history_json: dict) -> list[str]:
     Returns:
         arguments: A list of string representations of the arguments extracted from the history JSON.
     """
-    arguments = []
-    if "arguments" in history_json:
-        array = history_json["arguments"]
-        for i in range(len(array)):
-            cur_obj = array[i]
-            arg_name = cur_obj["name"]
-            arg_value = cur_obj.get("value", "")
-            arg_text = f"{arg_name}: {arg_value}"
-            arguments.append(arg_text)
-    return arguments
+    return [f'{argument["name"]}: {argument.get("value", "")}' for argument in history_json.get("arguments", [])]
 
 
 def _extract_output(history_json: dict) -> Tuple[list[str], bool]:
@@ -373,17 +481,14 @@ def _extract_output(history_json: dict) -> Tuple[list[str], bool]:
         if status.lower() == "success":
             run_status = True
     if "output" in history_json:
-        output_list = history_json["output"].split('\n')
-        for line in output_list:
-            if line.startswith("$XMS_BOLD$"):
-                line = line[len("$XMS_BOLD$"):]
-            if line.startswith("$XMS_LEVEL$"):
-                line = line[len("$XMS_LEVEL$"):]
-            output.append(line)
-
-        # remove empty lines at end of output
-        while output and not output[-1].strip():
-            output.pop()
+        text = _OUTPUT_MARKERS.sub('', history_json["output"])
+        # leave out empty lines at end of output, but keep the last line's trailing spaces
+        end = len(text.rstrip())
+        if end:
+            line_end = text.find('\n', end)
+            if line_end != -1:
+                text = text[:line_end]
+            output.extend(text.split('\n'))
     return output, run_status
 
 
@@ -399,10 +504,10 @@ def _create_output_items(output: list[str], description: str, uuid: str) -> QSta
     Returns:
         The output item that is created.
     """
-    output_item = _add_line_item("Output:", uuid, resource_path("tool_history_output_item.svg"))
-    _add_line_item(description, uuid, "", output_item)
+    output_item = _add_line_item("Output:", uuid, _OUTPUT_ICON)
+    _add_search_line_item(description, uuid, "", output_item)
     for line in output:
-        _add_line_item(line, uuid, "", output_item)
+        _add_search_line_item(line, uuid, "", output_item)
     return output_item
 
 
@@ -414,9 +519,9 @@ def _create_input_items(arguments: list[str], uuid: str):
         arguments: List of arguments.
         uuid: The uuid of the history item.
     """
-    input_item = _add_line_item("Input:", uuid, resource_path("tool_history_output_item.svg"))
+    input_item = _add_line_item("Input:", uuid, _OUTPUT_ICON)
     for argument in arguments:
-        _add_line_item(argument, uuid, resource_path("tool_history_arg_item.png"), input_item)
+        _add_search_line_item(argument, uuid, _ARGUMENT_ICON, input_item)
     return input_item
 
 
@@ -431,8 +536,21 @@ def string_matches_search(string: str, search_strings_lower: List[str]) -> bool:
     Returns:
         bool: True if all search strings are found in the lower-cased input string, False otherwise.
     """
-    str_lower = string.lower()
+    return _lower_string_matches_search(string.lower(), search_strings_lower)
+
+
+def _lower_string_matches_search(string_lower: str, search_strings_lower: List[str]) -> bool:
+    """
+    Determine if a lower-cased string matches a list of search strings.
+
+    Args:
+        string_lower: The lower-cased string to be checked.
+        search_strings_lower: The list of lower-cased search strings.
+
+    Returns:
+        bool: True if all search strings are found in the string, False otherwise.
+    """
     for search_string in search_strings_lower:
-        if search_string not in str_lower:
+        if search_string not in string_lower:
             return False
     return True
@@ -6,7 +6,7 @@ from typing import Any, Optional
 import uuid
 import xml.etree.ElementTree as Et
 
-from xms.tool_gui.tool_dialog import run_tool_dialog
+from xms.tool_gui.tool_dialog import load_class, run_tool_dialog
 
 
 def find_xms_model_definitions():
@@ -49,30 +49,32 @@ def find_xms_model_definitions():
         entry_pt = [x for x in dist.entry_points if x.group == 'xms.dmi.interfaces']
         if len(entry_pt) == 0:
             continue
-        if 'classifier' not in dist.metadata.json:
+        # dist.metadata parses the package's METADATA file each time it is used
+        classifiers = dist.metadata.json.get('classifier')
+        if not classifiers:
             continue
 
         # get the path to the distribution.
-        for line in dist.metadata.json['classifier']:
-            dmi_def = line.startswith('XMS DMI Definition')
-            dmi_migration = line.startswith('XMS DMI Migration')
-            if not dmi_def and not dmi_migration:
+        dist_path = None  # Only found if needed, since it imports the package
+        for line in classifiers:
+            if not line.startswith(('XMS DMI Definition', 'XMS DMI Migration')):
                 continue
-            cards = line.split(':')
-            if len(cards) < 4:
+            dmi_def = line.startswith('XMS DMI Definition')
+            cards = line.split('::', 2)
+            if len(cards) < 3:
                 continue
-            the_file = cards[4].strip()
+            the_file = cards[2].strip()
             # prefer call dist.locate_file(xml_file) but it doesn't work with pyproject develop installs
             file_path = str(dist.locate_file(the_file))
             if not os.path.isfile(file_path):
-                dist_path = entry_pt[0].load().__path__[0]
-                dist_path = os.path.normpath(os.path.join(dist_path, '..', '..'))
+                if dist_path is None:
+                    dist_path = os.path.normpath(os.path.join(entry_pt[0].load().__path__[0], '..', '..'))
                 file_path = os.path.normpath(os.path.join(dist_path, the_file))
                 if not os.path.isfile(file_path):
                     continue
             if dmi_def:
                 xml_files.append(file_path)
-            elif dmi_migration:
+            else:
                 migration_xml_files.append(file_path)
     return xml_files, migration_xml_files
 
@@ -81,21 +83,43 @@ def _find_tools() -> dict[str, dict[str, str]]:
     tools_xml_files, _ = find_xms_model_definitions()
     tools = {}
     for file in tools_xml_files:
-        tools_tree = Et.parse(file)
-        tools_xml = tools_tree.getroot()
-        for child in tools_xml:
-            tool = {}
-            for attribute in child.keys():
-                tool[attribute] = child.attrib[attribute]
-            tools[tool["uuid"]] = tool
+        # Stream the file, dropping each tool's elements once its attributes have been read
+        depth = 0
+        for event, element in Et.iterparse(file, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1:  # a tool, which is a child of the root element
+                tool = dict(element.attrib)
+                tools[tool["uuid"]] = tool
+                element.clear()
     return tools
 
 
+class _LazyTools:
+    """Class attribute that finds the tools the first time it is read, rather than when the module is imported."""
+
+    def __get__(self, instance, owner) -> dict[str, dict]:
+        """Find the tools and replace this attribute with them, so later reads are plain attribute lookups.
+
+        Args:
+            instance: The instance the attribute was read from, or None if read from the class.
+            owner: The class.
+
+        Returns:
+            The tools' attributes, keyed by tool UUID.
+        """
+        tools = _find_tools()
+        owner.tools = tools
+        return tools
+
+
 class ToolboxTools:
     """
     Manage toolbox tool info.
     """
-    tools: dict[str, dict] = _find_tools()
+    tools: dict[str, dict] = _LazyTools()
 
     @classmethod
     def get_tool_list(cls) -> list[dict]:
@@ -139,32 +163,23 @@ class ToolboxTools:
         Returns:
             The results of running the tool, or None if the tool is not found in the list of available tools.
         """
+        tools = cls.tools
         tool_uuid = run_input['tool_uuid']
-        if tool_uuid not in cls.tools:
+        if tool_uuid not in tools:
             print("Unable to find the tool in the list of currently available tools.")
             return
 
         module_name = run_input['module_name']
         class_name = run_input['class_name']
-        module = __import__(module_name, fromlist=[class_name])
-        klass = getattr(module, class_name)
+        klass = load_class(module_name, class_name)
         tool = klass()
 
-        tool_name = cls.tools[tool_uuid]["name"]
-        send_json = {'tool_name': tool_name, 'tool_description': cls.tools[tool_uuid]['description']}
+        tool_name = tools[tool_uuid]["name"]
+        send_json = {'tool_name': tool_name, 'tool_description': tools[tool_uuid]['description']}
 
         if 'arguments' in run_input:
-            args = run_input['arguments']
-            new_args = []
-            for arg in args:
-                new_args.append(arg)
-
-            send_json['arguments'] = new_args
-
-        keys = list(run_input.keys())
-        for key in keys:
-            if key != 'arguments':
-                send_json[key] = run_input[key]
+            send_json['arguments'] = list(run_input['arguments'])
+        send_json.update({key: value for key, value in run_input.items() if key != 'arguments'})
 
         tool.set_gui_data_folder(project_folder)
         tool.project_folder = project_folder
@@ -1,7 +1,9 @@
 """Export a project into a folder for use with tools."""
 # 1. Standard python modules
+from concurrent.futures import as_completed, ThreadPoolExecutor
 import logging
 from pathlib import Path
+import re
 import shlex
 
 # 2. Third party modules
@@ -15,6 +17,10 @@ from xms.core.filesystem import filesystem as xfs
 __copyright__ = "(C) Copyright Aquaveo 2022"
 __license__ = "All rights reserved"
 
+# A line of plain or double quoted words, the only form SMS writes for DS_XMDF cards
+_SIMPLE_WORDS = re.compile(r'\s*(?:(?:"[^"\\]*"|[^\s"\'\\]+)(?:\s+|$))*')
+_SIMPLE_WORD = re.compile(r'"([^"]*)"|(\S+)')
+
 
 def export_project(project_file: str, output_folder: str, logger: logging.Logger) -> None:
     """Export a project into a folder for use with tools.
@@ -42,13 +48,11 @@ def _get_sms_project_cards(project_file: str) -> list[list[str]]:
     Returns:
         The cards.
     """
-    cards = []
     with h5py.File(project_file) as file:
-        card_dataset = file['SmsProject/Cards'][:]
-        values_dataset = file['SmsProject/Values'][:]
-        for i in range(len(card_dataset)):
-            cards.append([card_dataset[i].decode('UTF-8'), values_dataset[i].decode('UTF-8')])
-    return cards
+        # Let h5py decode the strings as it reads them, rather than keeping the raw bytes and decoding each one
+        card_names = file['SmsProject/Cards'].asstr('UTF-8')[:].tolist()
+        card_values = file['SmsProject/Values'].asstr('UTF-8')[:].tolist()
+    return [[name, value] for name, value in zip(card_names, card_values)]
 
 
 def _get_grids(cards: list[list[str]], project_parent: Path) -> dict:
@@ -69,12 +73,10 @@ def _get_grids(cards: list[list[str]], project_parent: Path) -> dict:
             grid_path = grid_path.strip('"')
             grid_path = grid_path.replace('\\', '/')
             grid_path = project_parent / grid_path
-            grid_path.resolve()
             with h5py.File(grid_path) as file:
-                for item_name in file.keys():
-                    group_item = file[item_name]
+                # Only the top-level groups are grids, so there is no need to walk the whole tree
+                for grid_name, group_item in file.items():
                     if isinstance(group_item, h5py.Group):
-                        grid_name = group_item.name[1:]
                         uuid = group_item['PROPERTIES/GUID'][0].decode('UTF-8')
                         grids[uuid] = {'name': grid_name, 'file': grid_path.with_suffix('.xmc')}
     return grids
@@ -88,21 +90,34 @@ def _add_datasets(cards: list[list[str]], project_parent: Path, grids: dict):
         project_parent: The parent path for writing the grids and datasets.
         grids: A dictionary of grids by UUID.
     """
-    for i in range(len(cards)):
-        if cards[i][0] == 'GUID' and cards[i][1] in grids:
-            uuid = cards[i][1]
-            dset_idx = i + 1
+    datasets = None  # The dataset list of the grid whose DS_XMDF cards are being read, if any
+    for card_name, card_value in cards:
+        if card_name == 'DS_XMDF' and datasets is not None:
+            dataset_line = card_value.replace('\\', '/')
+            items = _split_words(dataset_line)
+            name = items[0]
+            dataset_path = project_parent / items[1]
+            datasets.append({'name': name, 'file': dataset_path})
+        elif card_name == 'GUID' and card_value in grids:
             datasets = []
-            while dset_idx < len(cards) and cards[dset_idx][0] == 'DS_XMDF':
-                dataset_line = cards[dset_idx][1]
-                dataset_line = dataset_line.replace('\\', '/')
-                items = shlex.split(dataset_line)
-                name = items[0]
-                dataset_path = project_parent / items[1]
-                dataset_path.resolve()
-                datasets.append({'name': name, 'file': dataset_path})
-                dset_idx += 1
-            grids[uuid]['datasets'] = datasets
+            grids[card_value]['datasets'] = datasets
+        else:
+            datasets = None
+
+
+def _split_words(line: str) -> list[str]:
+    """Split a line into words the way shlex.split does.
+
+    Args:
+        line: The line to split.
+
+    Returns:
+        The words.
+    """
+    if _SIMPLE_WORDS.fullmatch(line):
+        # Skip building a shlex tokenizer for the common case
+        return [quoted if plain == '' else plain for quoted, plain in _SIMPLE_WORD.findall(line)]
+    return shlex.split(line)
 
 
 def _copy_files(grids: dict, logger: logging.Logger, output_folder: str):
@@ -115,21 +130,36 @@ def _copy_files(grids: dict, logger: logging.Logger, output_folder: str):
     """
     grid_folder = Path(output_folder) / 'grids'
     grid_folder.mkdir(parents=True)
+    # Make the folders first, then copy the files in parallel since copying is I/O bound
+    copies = []  # (message logged once copied, file to copy, where to copy it)
     for grid in grids.values():
         grid_name = grid['name']
-        logger.info(f'Copying grid {grid_name}...')
         copy_to = grid_folder / grid_name
         copy_to = copy_to.with_suffix('.xmc')
-        xfs.copyfile(str(grid['file']), str(copy_to))
+        copies.append((f'Copied grid {grid_name}.', grid['file'], copy_to))
         grid_datasets = grid['datasets']
         if len(grid_datasets) > 0:
             dataset_folder = grid_folder / grid_name
             dataset_folder.mkdir()
+            made_folders = {dataset_folder}
             for dataset in grid['datasets']:
                 dataset_name = dataset['name']
-                logger.info(f'Copying dataset {dataset_name}...')
                 copy_to = dataset_folder / dataset_name
                 copy_to = copy_to.with_suffix('.h5')
                 parent_path = copy_to.parent
-                parent_path.mkdir(parents=True, exist_ok=True)
-                xfs.copyfile(str(dataset['file']), str(copy_to))
+                if parent_path not in made_folders:  # Dataset names can contain '/'
+                    parent_path.mkdir(parents=True, exist_ok=True)
+                    made_folders.add(parent_path)
+                copies.append((f'Copied dataset {dataset_name}.', dataset['file'], copy_to))
+
+    with ThreadPoolExecutor() as executor:
+        futures = {executor.submit(xfs.copyfile, str(copy_from), str(copy_to)): message
+                   for message, copy_from, copy_to in copies}
+        # Log each file as it is copied, so the log shows the progress
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except OSError:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            logger.info(futures[future])
@@ -1,6 +1,7 @@
 """Tool to transform Ugrid points."""
 
 # 1. Standard python modules
+import io
 from pathlib import Path
 import subprocess
 
@@ -9,7 +10,6 @@ import numpy as np
 
 # 3. Aquaveo modules
 from xms.constraint import UnconstrainedGrid
-from xms.core.filesystem import filesystem
 from xms.grid.ugrid import UGrid
 from xms.tool_core import Argument, IoDirection, Tool
 
@@ -61,7 +61,7 @@ class TransformUgridPointsTool(Tool):
         epsg_code_to = arguments[self.ARG_EPSG_CODE_TO].value
         co_grid_in = self.get_input_grid(input_grid)
         ugrid_in = co_grid_in.ugrid
-        locations_in = np.array(ugrid_in.locations)
+        locations_in = np.ascontiguousarray(ugrid_in.locations, dtype=np.float64)
 
         # get the new grid point locations and WKT
         locations_out = self._transform_points(gdal_tools_path, locations_in, epsg_code_from, epsg_code_to)
@@ -88,25 +88,22 @@ class TransformUgridPointsTool(Tool):
             The transformed points.
         """
         self.logger.info("Running gdaltransform to transform the locations.")
-        # write the input points to a temporary file
-        temp_point_file_in = filesystem.temp_filename()
-        np.savetxt(temp_point_file_in, locations_in, fmt='%d')
-
-        # run the command with stdin redirected from the input point file
-        # and stdout redirected to the output point file
-        temp_point_file_out = filesystem.temp_filename()
+        # pipe the points through the command rather than writing them to temporary files, using enough digits to
+        # write each coordinate exactly
+        format_value = '{:.17g}'.format
+        points_in = ''.join(' '.join(map(format_value, point)) + '\n' for point in locations_in.tolist())
         try:
             transform_command = _get_command_path(gdal_tools_path, "gdaltransform")
             arguments = [transform_command, "-s_srs", f"EPSG:{epsg_code_from}", "-t_srs", f"EPSG:{epsg_code_to}"]
-            with open(temp_point_file_in, "r") as point_file_in, open(temp_point_file_out, "w") as point_file_out:
-                subprocess.run(arguments, stdin=point_file_in, stdout=point_file_out, stderr=subprocess.PIPE,
-                               check=True)
+            result = subprocess.run(arguments, input=points_in, capture_output=True, text=True,
+                                    check=True)
         except subprocess.CalledProcessError as e:
             error = f"Unable to run gdaltransform: {str(e)}"
             self.fail(error)
+            raise  # fail() raises a ToolError, so this only keeps an unset result from being used
 
-        # read the transformed points from the output file
-        transformed_points = np.loadtxt(temp_point_file_out)
+        # read the transformed points from the command output
+        transformed_points = np.loadtxt(io.StringIO(result.stdout))
         return transformed_points
 
     def _wkt_from_epsg(self, gdal_tools_path: str, epsg_code: int) -> str | None: